@@ -52,6 +52,14 @@ setup(
             'Flask>=3.0.0',
             'flask-cors>=4.0.0',
         ],
+        'fast': [
+            'orjson>=3.9.0',
+        ],
+        'asgi': [
+            'starlette>=0.27.0',
+            'uvicorn[standard]>=0.23.0',
+            'Jinja2>=3.1.0',
+        ],
         'dev': [
             'pytest>=7.4.0',
             'pytest-cov>=4.1.0',
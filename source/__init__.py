@@ -7,11 +7,16 @@ Author: İsmail Taşdelen
 """
 
 from source.rpg import (
+    PasswordMeta,
     generate_password,
     generate_passphrase,
+    generate_passphrases_batch,
     generate_multiple_passwords,
+    generate_multiple_passwords_custom,
+    generate_passwords_batch,
     generate_pin,
     generate_hex_key,
+    iter_passwords,
     random_password_generator,
     random_password_generator_ico
 )
@@ -21,11 +26,16 @@ __author__ = 'İsmail Taşdelen'
 __email__ = 'pentestdatabase@gmail.com'
 
 __all__ = [
+    'PasswordMeta',
     'generate_password',
     'generate_passphrase',
+    'generate_passphrases_batch',
     'generate_multiple_passwords',
+    'generate_multiple_passwords_custom',
+    'generate_passwords_batch',
     'generate_pin',
     'generate_hex_key',
+    'iter_passwords',
     'random_password_generator',
     'random_password_generator_ico',
 ]
@@ -7,104 +7,339 @@ Modern argparse-based CLI with rich features.
 """
 
 import sys
-import argparse
-from typing import Optional
-
-# Conditional imports for optional dependencies
-try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-    HAS_COLORAMA = True
-except ImportError:
-    HAS_COLORAMA = False
-    # Fallback no-op definitions
-    class Fore:
-        RED = YELLOW = GREEN = CYAN = MAGENTA = WHITE = LIGHTRED_EX = LIGHTGREEN_EX = ''
-    class Style:
-        BRIGHT = RESET_ALL = DIM = ''
+import functools
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import argparse
 
 from source import rpg
-from source.strength import analyze_password_strength, format_strength_bar, get_strength_emoji
+from source.strength import (
+    analyze_password_strength, format_strength_bar, get_strength_emoji,
+    CLASS_UPPERCASE, CLASS_LOWERCASE, CLASS_DIGITS, CLASS_SPECIAL
+)
 from source.utils import (
     copy_to_clipboard, generate_qr_code, export_passwords,
-    save_to_history
+    save_to_history_batch
 )
 from source.config import Config
 
+# Colors are set up on the first colored print, so code paths that never
+# print in color don't pay for it. Only Windows needs colorama; elsewhere
+# ANSI codes are written directly.
+_USE_COLORS = False
+_colors_inited = False
 
-def print_colored(text: str, color: str = '', style: str = '') -> None:
-    """Print colored text if colorama is available."""
-    if HAS_COLORAMA:
-        color_code = getattr(Fore, color.upper(), '')
-        style_code = getattr(Style, style.upper(), '')
-        print(f"{style_code}{color_code}{text}{Style.RESET_ALL}")
+# ANSI codes for the colors and styles used by the CLI
+_ANSI_COLORS = {
+    'RED': '\x1b[31m', 'GREEN': '\x1b[32m', 'YELLOW': '\x1b[33m',
+    'MAGENTA': '\x1b[35m', 'CYAN': '\x1b[36m', 'WHITE': '\x1b[37m',
+    'LIGHTRED_EX': '\x1b[91m', 'LIGHTGREEN_EX': '\x1b[92m',
+}
+_ANSI_STYLES = {'BRIGHT': '\x1b[1m', 'DIM': '\x1b[2m', 'RESET_ALL': '\x1b[0m'}
+
+# Color and style codes by name, filled in by _init_colors()
+_COLORS: Dict[str, str] = {}
+_STYLES: Dict[str, str] = {}
+_RESET = ''
+
+# Combined style + color prefix per (color, style) pair
+_PREFIX_CACHE: Dict[Tuple[str, str], str] = {}
+
+
+def _init_colors() -> None:
+    """Set up terminal colors once, using colorama on Windows."""
+    global _USE_COLORS, _colors_inited, _RESET
+    
+    _colors_inited = True
+    
+    if sys.platform == 'win32':
+        try:
+            import colorama
+        except ImportError:
+            return
+        colorama.init(autoreset=True)
+        _COLORS.update(vars(colorama.Fore))
+        _STYLES.update(vars(colorama.Style))
     else:
-        print(text)
+        # Like colorama, don't emit escape codes into pipes and files
+        if not sys.stdout.isatty():
+            return
+        _COLORS.update(_ANSI_COLORS)
+        _STYLES.update(_ANSI_STYLES)
+    
+    _RESET = _STYLES['RESET_ALL']
+    _USE_COLORS = True
 
 
-def print_banner() -> None:
-    """Print RPG banner."""
-    banner = """
+def _prefix(color: str = '', style: str = '') -> str:
+    """Get the escape codes that start the given color/style ('' if unsupported)."""
+    if not _colors_inited:
+        _init_colors()
+    
+    if not _USE_COLORS:
+        return ''
+    
+    key = (color, style)
+    prefix = _PREFIX_CACHE.get(key)
+    if prefix is None:
+        prefix = _STYLES.get(style.upper(), '') + _COLORS.get(color.upper(), '')
+        _PREFIX_CACHE[key] = prefix
+    
+    return prefix
+
+
+def _colored(text: str, color: str = '', style: str = '') -> str:
+    """Wrap text in color codes if the terminal supports them."""
+    prefix = _prefix(color, style)
+    return f"{prefix}{text}{_RESET}"
+
+
+def print_colored(text: str, color: str = '', style: str = '') -> None:
+    """Print colored text if the terminal supports it."""
+    print(_colored(text, color, style))
+
+
+BANNER = """
     ╔═══════════════════════════════════════════════════════════╗
     ║     🔐 Random Password Generator (RPG) v2.0 🔐            ║
     ║                  Secure & Modern                          ║
     ╚═══════════════════════════════════════════════════════════╝
     """
-    print_colored(banner, 'CYAN', 'BRIGHT')
 
 
-def print_password(password: str, show_strength: bool = True) -> None:
+def print_banner() -> None:
+    """Print RPG banner."""
+    print_colored(BANNER, 'CYAN', 'BRIGHT')
+
+
+# Report templates for print_password(), filled with str.format_map()
+_RULE = '━' * 53
+_REPORT_TMPL = (
+    "{rule_style}\n" + _RULE + "{reset}\n"
+    "{password_style}  Password: {password}{reset}\n"
+    "{rule_style}" + _RULE + "\n{reset}\n"
+)
+_STRENGTH_REPORT_TMPL = _REPORT_TMPL + (
+    "{strength_style}  {emoji} Strength: {strength}{reset}\n"
+    "  {bar}\n"
+    "  Length: {length} | Entropy: {entropy} bits\n"
+    "  Characters: {chars}\n"
+    "{suggestions}\n"
+)
+_SUGGESTIONS_TMPL = "{suggestions_style}\n  💡 Suggestions:{reset}\n"
+
+# Labels for the character classes shown in the report
+_CLASS_LABELS = (
+    (CLASS_UPPERCASE, 'ABC'),
+    (CLASS_LOWERCASE, 'abc'),
+    (CLASS_DIGITS, '123'),
+    (CLASS_SPECIAL, '!@#'),
+)
+
+
+def print_password(
+    password: str,
+    show_strength: bool = True,
+    char_classes: Optional[int] = None
+) -> None:
     """
     Print password with optional strength analysis.
     
     Args:
         password: Password to print
         show_strength: Whether to show strength analysis
+        char_classes: Character class mask of the password, if already known
     """
-    print_colored("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", 'CYAN')
-    print_colored(f"  Password: {password}", 'GREEN', 'BRIGHT')
-    print_colored("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", 'CYAN')
+    fields = {
+        'rule_style': _prefix('CYAN'),
+        'password_style': _prefix('GREEN', 'BRIGHT'),
+        'password': password,
+    }
+    # Read after _prefix(), which initializes colors and _RESET
+    fields['reset'] = _RESET
     
-    if show_strength:
-        analysis = analyze_password_strength(password)
-        
-        # Determine color based on score
-        if analysis['score'] < 40:
-            strength_color = 'LIGHTRED_EX'
-        elif analysis['score'] < 70:
-            strength_color = 'YELLOW'
-        else:
-            strength_color = 'LIGHTGREEN_EX'
-        
-        emoji = get_strength_emoji(analysis['score'])
-        
-        print_colored(f"  {emoji} Strength: {analysis['strength']}", strength_color, 'BRIGHT')
-        print(f"  {format_strength_bar(analysis['score'])}")
-        print(f"  Length: {analysis['length']} | Entropy: {analysis['entropy']} bits")
-        
-        # Character composition
-        chars = []
-        if analysis['has_uppercase']:
-            chars.append("ABC")
-        if analysis['has_lowercase']:
-            chars.append("abc")
-        if analysis['has_digits']:
-            chars.append("123")
-        if analysis['has_special']:
-            chars.append("!@#")
-        print(f"  Characters: {' + '.join(chars)}")
-        
-        # Feedback
-        if analysis['feedback']:
-            print_colored("\n  💡 Suggestions:", 'YELLOW')
-            for feedback in analysis['feedback']:
-                print(f"     • {feedback}")
+    if not show_strength:
+        sys.stdout.write(_REPORT_TMPL.format_map(fields))
+        return
+    
+    analysis = analyze_password_strength(password, char_classes)
+    
+    # Determine color based on score
+    if analysis['score'] < 40:
+        strength_color = 'LIGHTRED_EX'
+    elif analysis['score'] < 70:
+        strength_color = 'YELLOW'
+    else:
+        strength_color = 'LIGHTGREEN_EX'
+    
+    # Character composition
+    char_classes = analysis['char_classes']
+    chars = [label for bit, label in _CLASS_LABELS if char_classes & bit]
+    
+    # Feedback
+    suggestions = ''
+    if analysis['feedback']:
+        fields['suggestions_style'] = _prefix('YELLOW')
+        suggestions = _SUGGESTIONS_TMPL.format_map(fields) + ''.join(
+            f"     • {feedback}\n" for feedback in analysis['feedback']
+        )
+    
+    fields.update(
+        strength_style=_prefix(strength_color, 'BRIGHT'),
+        emoji=get_strength_emoji(analysis['score']),
+        strength=analysis['strength'],
+        bar=format_strength_bar(analysis['score']),
+        length=analysis['length'],
+        entropy=analysis['entropy'],
+        chars=' + '.join(chars),
+        suggestions=suggestions,
+    )
+    sys.stdout.write(_STRENGTH_REPORT_TMPL.format_map(fields))
+
+
+# Parsed values for a bare `rpg` invocation; must match _build_parser() defaults
+_DEFAULT_ARGS = {
+    'length': 16, 'count': 1, 'no_uppercase': False, 'no_lowercase': False,
+    'no_digits': False, 'no_special': False, 'custom_chars': None,
+    'passphrase': False, 'words': 4, 'separator': '-', 'no_capitalize': False,
+    'add_number': False, 'copy': False, 'qrcode': False, 'qr_file': None,
+    'strength': True, 'no_strength': False, 'output': None, 'template': None,
+    'config': None, 'list_templates': False, 'create_config': None,
+    'pin': None, 'hex': None, 'verbose': False, 'no_banner': False,
+}
+
+# Options the fast path understands when given alone with an integer value
+_FAST_INT_OPTIONS = {'-l': 'length', '--length': 'length', '-c': 'count', '--count': 'count'}
+
+
+def _parse_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the most common invocations without argparse.
+    
+    Handles `rpg` with no arguments and `rpg -l N` / `rpg -c N` (and their
+    long forms). Anything else returns None so the full parser handles it.
+    
+    Args:
+        argv: Command-line arguments
+    
+    Returns:
+        Parsed arguments, or None if the fast path does not apply
+    """
+    args = SimpleNamespace(**_DEFAULT_ARGS)
+    
+    if not argv:
+        return args
+    
+    if len(argv) == 2 and argv[0] in _FAST_INT_OPTIONS:
+        try:
+            value = int(argv[1])
+        except ValueError:
+            return None
+        setattr(args, _FAST_INT_OPTIONS[argv[0]], value)
+        return args
+    
+    return None
+
+
+# Passwords generated per bulk random read in _iter_passwords()
+_BATCH_SIZE = 256
+
+
+def _iter_passwords(args, with_meta: bool = False) -> Iterator[Tuple[str, Optional['rpg.PasswordMeta']]]:
+    """
+    Yield the passwords or passphrases requested on the command line.
+    
+    Multiple passphrases, and multiple passwords that need no metadata
+    (custom character set, or strength display off), are generated in
+    batches of up to _BATCH_SIZE. As with single passwords generated in a
+    loop, duplicates are not removed.
+    
+    Args:
+        args: Parsed command-line arguments
+        with_meta: Ask rpg.generate_password() for a PasswordMeta where it
+            can provide one
+    
+    Yields:
+        (password, meta) tuples, args.count in total; meta is None for
+        passphrases and batch-generated passwords
+    """
+    if args.count > 1 and args.passphrase:
+        generate_batch = functools.partial(
+            rpg.generate_passphrases_batch,
+            word_count=args.words,
+            separator=args.separator,
+            capitalize=not args.no_capitalize,
+            include_number=args.add_number
+        )
         
-        print()
+        remaining = args.count
+        while remaining > 0:
+            batch = min(remaining, _BATCH_SIZE)
+            for password in generate_batch(batch):
+                yield password, None
+            remaining -= batch
+        return
+    
+    if args.count > 1 and (args.custom_chars or not with_meta):
+        passwords = rpg.iter_passwords(
+            args.count,
+            args.length,
+            batch_size=_BATCH_SIZE,
+            unique=False,
+            use_uppercase=not args.no_uppercase,
+            use_lowercase=not args.no_lowercase,
+            use_digits=not args.no_digits,
+            use_special=not args.no_special,
+            custom_chars=args.custom_chars
+        )
+        for password in passwords:
+            yield password, None
+        return
+    
+    # Resolve the generator and its arguments once, outside the loop
+    if args.passphrase:
+        generate = rpg.generate_passphrase
+        kwargs = dict(
+            word_count=args.words,
+            separator=args.separator,
+            capitalize=not args.no_capitalize,
+            include_number=args.add_number
+        )
+    else:
+        generate = rpg.generate_password
+        kwargs = dict(
+            length=args.length,
+            use_uppercase=not args.no_uppercase,
+            use_lowercase=not args.no_lowercase,
+            use_digits=not args.no_digits,
+            use_special=not args.no_special,
+            custom_chars=args.custom_chars,
+            with_meta=with_meta
+        )
+        if with_meta:
+            for _ in range(args.count):
+                yield generate(**kwargs)
+            return
+    
+    for _ in range(args.count):
+        yield generate(**kwargs), None
 
 
-def main() -> int:
-    """Main CLI entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> 'argparse.ArgumentParser':
+    """
+    Build the CLI argument parser.
+    
+    The parser holds no per-invocation state, so it is built once and
+    reused by every call to main().
+    
+    Returns:
+        Configured argument parser
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='🔐 Random Password Generator - Secure password and passphrase generation',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -200,10 +435,25 @@ Templates:
                        help='Don\'t show banner')
     parser.add_argument('--version', action='version', version='RPG 2.0.0')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
     
-    # Show banner unless disabled
-    if not args.no_banner:
+    Returns:
+        Process exit code
+    """
+    args = _parse_fast(sys.argv[1:] if argv is None else argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
+    
+    # Show banner unless disabled or output is piped
+    if not args.no_banner and sys.stdout.isatty():
         print_banner()
     
     # Load configuration
@@ -244,59 +494,59 @@ Templates:
     
     # Apply template if specified
     if args.template:
-        template = config.get_template(args.template)
-        if not template:
+        template = config.get_resolved_template(args.template)
+        if template is None:
             print_colored(f"⚠️  Unknown template: {args.template}", 'RED')
             print(f"   Use --list-templates to see available templates")
             return 1
         
         # Apply template settings (command line args override template)
-        if 'passphrase' in template and template['passphrase']:
+        if template.passphrase:
             args.passphrase = True
-            args.words = template.get('word_count', args.words)
-            args.separator = template.get('separator', args.separator)
+            if template.word_count is not None:
+                args.words = template.word_count
+            if template.separator is not None:
+                args.separator = template.separator
         else:
-            if 'length' in template:
-                args.length = template['length']
-            if 'custom_chars' in template:
-                args.custom_chars = template['custom_chars']
+            if template.length is not None:
+                args.length = template.length
+            if template.custom_chars is not None:
+                args.custom_chars = template.custom_chars
     
-    # Generate passwords
+    # Generate passwords (only kept in memory when something needs them later)
     passwords = []
+    save_history = config.get('output.save_to_history', False)
+    keep_passwords = bool(args.output or args.copy or args.qrcode or save_history)
+    show_strength = args.strength and not args.no_strength
     
     try:
-        for i in range(args.count):
-            if args.passphrase:
-                password = rpg.generate_passphrase(
-                    word_count=args.words,
-                    separator=args.separator,
-                    capitalize=not args.no_capitalize,
-                    include_number=args.add_number
-                )
-            else:
-                password = rpg.generate_password(
-                    length=args.length,
-                    use_uppercase=not args.no_uppercase,
-                    use_lowercase=not args.no_lowercase,
-                    use_digits=not args.no_digits,
-                    use_special=not args.no_special,
-                    custom_chars=args.custom_chars
-                )
+        # Bind hot-loop callables to locals
+        write = sys.stdout.write
+        keep = passwords.append
+        analyze = analyze_password_strength
+        strength_emoji = get_strength_emoji
+        single = args.count == 1
+        
+        for i, (password, meta) in enumerate(_iter_passwords(args, show_strength)):
+            if keep_passwords:
+                keep(password)
             
-            passwords.append(password)
+            # The generator already knows which character classes it used
+            char_classes = meta.char_classes if meta is not None else None
             
             # Print password
-            show_strength = args.strength and not args.no_strength
-            if args.count == 1:
-                print_password(password, show_strength)
+            if single:
+                print_password(password, show_strength, char_classes)
             else:
                 # Multiple passwords - simpler output
                 if show_strength:
-                    analysis = analyze_password_strength(password)
-                    emoji = get_strength_emoji(analysis['score'])
-                    print(f"  {i+1}. {password} {emoji} ({analysis['strength']})")
+                    analysis = analyze(password, char_classes)
+                    emoji = strength_emoji(analysis['score'])
+                    write(f"  {i+1}. {password} {emoji} ({analysis['strength']})\n")
                 else:
-                    print(f"  {i+1}. {password}")
+                    write(f"  {i+1}. {password}\n")
+        
+        sys.stdout.flush()
         
         # Copy to clipboard (first password if multiple)
         if args.copy and passwords:
@@ -315,9 +565,8 @@ Templates:
             export_passwords(passwords, args.output)
         
         # Save to history
-        if config.get('output.save_to_history', False):
-            for pwd in passwords:
-                save_to_history(pwd)
+        if save_history:
+            save_to_history_batch(passwords)
         
         return 0
         
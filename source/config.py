@@ -6,19 +6,67 @@ Configuration Management Module
 Handles loading and managing user preferences and password templates.
 """
 
+import copy
+import functools
 import json
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
-# Optional YAML support
+# Optional faster JSON backend
 try:
-    import yaml
-    HAS_YAML = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_YAML = False
+    HAS_ORJSON = False
 
 
-DEFAULT_CONFIG = {
+def _import_yaml() -> Any:
+    """
+    Import PyYAML on first use, keeping it off the CLI startup path.
+    
+    Returns:
+        The yaml module, or None if PyYAML is not installed
+    """
+    try:
+        import yaml
+        return yaml
+    except ImportError:
+        return None
+
+
+def _load_json(f: Any) -> Any:
+    """Parse JSON from an open text file, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(f.read())
+    return json.load(f)
+
+
+def _dump_json(data: Any, f: Any) -> None:
+    """Write data as indented JSON to an open text file, using orjson when available."""
+    if HAS_ORJSON:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8'))
+    else:
+        json.dump(data, f, indent=2)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dictionaries in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert (read-only) mappings back into plain dictionaries."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+# Read-only; Config instances copy a section only when they modify it
+DEFAULT_CONFIG = _freeze({
     'defaults': {
         'length': 16,
         'use_uppercase': True,
@@ -72,7 +120,53 @@ DEFAULT_CONFIG = {
         'use_colors': True,
         'save_to_history': False
     }
-}
+})
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config_file(path_str: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a configuration file, memoized by path and modification time.
+    
+    Callers must not mutate the returned dictionary; it is shared between
+    every load of the same unmodified file.
+    
+    Args:
+        path_str: Path to the configuration file
+        mtime: Modification time of the file (part of the cache key)
+    
+    Returns:
+        Parsed configuration dictionary
+    """
+    path = Path(path_str)
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix.lower() in ['.yaml', '.yml']:
+            return _import_yaml().safe_load(f)
+        return _load_json(f)
+
+
+def _deep_merge(target: Dict[str, Any], updates: Mapping[str, Any]) -> None:
+    """Recursively merge updates into target in place."""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_merge(target[key], value)
+        else:
+            target[key] = value
+
+
+@dataclass(frozen=True)
+class TemplateSettings:
+    """
+    Template fields used by the CLI, resolved once per template.
+    
+    Fields left as None were not set by the template.
+    """
+    passphrase: bool = False
+    length: Optional[int] = None
+    custom_chars: Optional[str] = None
+    word_count: Optional[int] = None
+    separator: Optional[str] = None
 
 
 class Config:
@@ -86,7 +180,10 @@ class Config:
             config_file: Path to configuration file (JSON or YAML)
         """
         self.config_file = config_file
-        self.config = DEFAULT_CONFIG.copy()
+        self._config: Dict[str, Any] = dict(DEFAULT_CONFIG)
+        self._flat: Dict[str, Any] = {}
+        self._resolved_templates: Dict[str, Optional[TemplateSettings]] = {}
+        self._rebuild_index()
         
         if config_file:
             self.load(config_file)
@@ -108,20 +205,22 @@ class Config:
                 print(f"⚠️  Config file not found: {config_file}")
                 return False
             
-            with open(path, 'r', encoding='utf-8') as f:
-                if path.suffix.lower() in ['.yaml', '.yml']:
-                    if not HAS_YAML:
-                        print("⚠️  YAML support not available. Install PyYAML: pip install PyYAML")
-                        return False
-                    loaded_config = yaml.safe_load(f)
-                elif path.suffix.lower() == '.json':
-                    loaded_config = json.load(f)
-                else:
-                    print(f"⚠️  Unsupported config format: {path.suffix}")
+            if path.suffix.lower() in ['.yaml', '.yml']:
+                if _import_yaml() is None:
+                    print("⚠️  YAML support not available. Install PyYAML: pip install PyYAML")
                     return False
+            elif path.suffix.lower() != '.json':
+                print(f"⚠️  Unsupported config format: {path.suffix}")
+                return False
+            
+            # Parsed files are cached, so merge a private copy
+            loaded_config = copy.deepcopy(
+                _parse_config_file(str(path.resolve()), path.stat().st_mtime)
+            )
             
             # Merge with defaults
             self._merge_config(loaded_config)
+            self._rebuild_index()
             print(f"✓ Configuration loaded from: {config_file}")
             return True
             
@@ -129,18 +228,55 @@ class Config:
             print(f"⚠️  Failed to load config: {e}")
             return False
     
+    @property
+    def config(self) -> Dict[str, Any]:
+        """
+        The full configuration as plain, mutable dictionaries.
+        
+        Sections still shared with DEFAULT_CONFIG are copied on first
+        access, as they are by set(). Edits made through this dictionary are
+        not seen by get() until set() or load() is called.
+        """
+        for key, value in list(self._config.items()):
+            if isinstance(value, Mapping):
+                self._writable_section(key)
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._rebuild_index()
+    
     def _merge_config(self, new_config: Dict[str, Any]) -> None:
         """
-        Merge new configuration with existing config.
+        Merge new configuration with existing config (recursively).
         
         Args:
             new_config: New configuration dictionary
         """
         for key, value in new_config.items():
-            if key in self.config and isinstance(value, dict):
-                self.config[key].update(value)
+            if key in self._config and isinstance(value, dict):
+                _deep_merge(self._writable_section(key), value)
             else:
-                self.config[key] = value
+                self._config[key] = value
+    
+    def _writable_section(self, key: str) -> Dict[str, Any]:
+        """
+        Get a top-level section that is safe to modify in place.
+        
+        Sections still shared with DEFAULT_CONFIG are copied on first write.
+        
+        Args:
+            key: Top-level configuration key
+        
+        Returns:
+            Mutable section dictionary
+        """
+        section = self._config.get(key)
+        if not isinstance(section, dict):
+            section = _thaw(section) if isinstance(section, Mapping) else {}
+            self._config[key] = section
+        return section
     
     def save(self, config_file: Optional[str] = None) -> bool:
         """
@@ -163,12 +299,13 @@ class Config:
             
             with open(path, 'w', encoding='utf-8') as f:
                 if path.suffix.lower() in ['.yaml', '.yml']:
-                    if not HAS_YAML:
+                    yaml = _import_yaml()
+                    if yaml is None:
                         print("⚠️  YAML support not available. Install PyYAML: pip install PyYAML")
                         return False
-                    yaml.dump(self.config, f, default_flow_style=False)
+                    yaml.dump(_thaw(self._config), f, default_flow_style=False)
                 elif path.suffix.lower() == '.json':
-                    json.dump(self.config, f, indent=2)
+                    _dump_json(_thaw(self._config), f)
                 else:
                     print(f"⚠️  Unsupported config format: {path.suffix}")
                     return False
@@ -189,17 +326,11 @@ class Config:
             default: Default value if key not found
         
         Returns:
-            Configuration value
+            Configuration value (sections as plain dictionaries)
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
+        value = self._flat.get(key, default)
+        if isinstance(value, MappingProxyType):
+            return _thaw(value)
         return value
     
     def set(self, key: str, value: Any) -> None:
@@ -210,15 +341,36 @@ class Config:
             key: Configuration key (supports dot notation)
             value: Value to set
         """
-        keys = key.split('.')
-        config = self.config
+        if '.' not in key:
+            self._config[key] = value
+        else:
+            keys = key.split('.')
+            config = self._writable_section(keys[0])
+            
+            for k in keys[1:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            
+            config[keys[-1]] = value
+        
+        self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the flat dot-path index used by get() and drop resolved templates."""
+        flat: Dict[str, Any] = {}
+        stack = [('', self._config)]
         
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, Mapping):
+                    stack.append((f"{path}.", value))
         
-        config[keys[-1]] = value
+        self._flat = flat
+        self._resolved_templates.clear()
     
     def get_template(self, template_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -230,7 +382,32 @@ class Config:
         Returns:
             Template configuration or None if not found
         """
-        return self.config.get('templates', {}).get(template_name)
+        template = self._config.get('templates', {}).get(template_name)
+        if isinstance(template, MappingProxyType):
+            return _thaw(template)
+        return template
+    
+    def get_resolved_template(self, template_name: str) -> Optional[TemplateSettings]:
+        """
+        Get template settings as a TemplateSettings object (cached).
+        
+        Args:
+            template_name: Name of the template
+        
+        Returns:
+            Resolved template settings or None if not found or empty
+        """
+        if template_name not in self._resolved_templates:
+            template = self.get_template(template_name)
+            self._resolved_templates[template_name] = TemplateSettings(
+                passphrase=bool(template.get('passphrase', False)),
+                length=template.get('length'),
+                custom_chars=template.get('custom_chars'),
+                word_count=template.get('word_count'),
+                separator=template.get('separator'),
+            ) if template else None
+        
+        return self._resolved_templates[template_name]
     
     def list_templates(self) -> list:
         """
@@ -239,7 +416,7 @@ class Config:
         Returns:
             List of template names
         """
-        return list(self.config.get('templates', {}).keys())
+        return list(self._config.get('templates', {}).keys())
 
 
 def create_example_config(filename: str = 'config.example.yaml') -> bool:
@@ -257,15 +434,16 @@ def create_example_config(filename: str = 'config.example.yaml') -> bool:
         
         with open(path, 'w', encoding='utf-8') as f:
             if path.suffix.lower() in ['.yaml', '.yml']:
-                if not HAS_YAML:
+                yaml = _import_yaml()
+                if yaml is None:
                     print("⚠️  YAML support not available. Creating JSON config instead...")
                     filename = filename.replace('.yaml', '.json').replace('.yml', '.json')
                     path = Path(filename)
-                    json.dump(DEFAULT_CONFIG, f, indent=2)
+                    _dump_json(_thaw(DEFAULT_CONFIG), f)
                 else:
-                    yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False, sort_keys=False)
+                    yaml.dump(_thaw(DEFAULT_CONFIG), f, default_flow_style=False, sort_keys=False)
             else:
-                json.dump(DEFAULT_CONFIG, f, indent=2)
+                _dump_json(_thaw(DEFAULT_CONFIG), f)
         
         print(f"✓ Example config created: {filename}")
         print(f"  Copy it to 'config.yaml' (or .json) and customize as needed")
@@ -11,9 +11,60 @@ LinkedIn: https://www.linkedin.com/in/ismailtasdelen
 Version: 2.0.0
 """
 
+import functools
+import itertools
+import math
 import secrets
 import string
-from typing import List, Optional, Set
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from source.strength import (
+    CLASS_DIGITS, CLASS_LOWERCASE, CLASS_SPECIAL, CLASS_UPPERCASE,
+    calculate_entropy, get_char_classes,
+)
+
+
+@dataclass(frozen=True)
+class PasswordMeta:
+    """Properties of a generated password, known from how it was built."""
+    length: int
+    has_uppercase: bool
+    has_lowercase: bool
+    has_digits: bool
+    has_special: bool
+    entropy: float
+    
+    @property
+    def char_classes(self) -> int:
+        """Bitmask of the character classes present (strength.CLASS_* constants)."""
+        return (
+            (CLASS_UPPERCASE if self.has_uppercase else 0)
+            | (CLASS_LOWERCASE if self.has_lowercase else 0)
+            | (CLASS_DIGITS if self.has_digits else 0)
+            | (CLASS_SPECIAL if self.has_special else 0)
+        )
+
+
+def _password_meta(password: str, char_classes: int) -> PasswordMeta:
+    """
+    Build the PasswordMeta for a password whose character classes are known.
+    
+    Args:
+        password: The generated password
+        char_classes: Bitmask of the character classes it contains
+    
+    Returns:
+        PasswordMeta for the password
+    """
+    return PasswordMeta(
+        length=len(password),
+        has_uppercase=bool(char_classes & CLASS_UPPERCASE),
+        has_lowercase=bool(char_classes & CLASS_LOWERCASE),
+        has_digits=bool(char_classes & CLASS_DIGITS),
+        has_special=bool(char_classes & CLASS_SPECIAL),
+        entropy=calculate_entropy(password, char_classes),
+    )
 
 
 def generate_password(
@@ -22,8 +73,9 @@ def generate_password(
     use_lowercase: bool = True,
     use_digits: bool = True,
     use_special: bool = True,
-    custom_chars: Optional[str] = None
-) -> str:
+    custom_chars: Optional[str] = None,
+    with_meta: bool = False
+) -> Union[str, Tuple[str, PasswordMeta]]:
     """
     Generate a cryptographically secure random password.
     
@@ -34,9 +86,11 @@ def generate_password(
         use_digits: Include digits (default: True)
         use_special: Include special characters (default: True)
         custom_chars: Custom character set to use (overrides other options)
+        with_meta: Also return a PasswordMeta describing the password
     
     Returns:
-        A randomly generated password string
+        A randomly generated password string, or a (password, PasswordMeta)
+        tuple if with_meta is True
         
     Raises:
         ValueError: If length < 1 or no character types are selected
@@ -56,47 +110,390 @@ def generate_password(
     if custom_chars:
         if not custom_chars:
             raise ValueError("Custom character set cannot be empty")
-        return ''.join(secrets.choice(custom_chars) for _ in range(length))
+        password = _sample_chars(custom_chars, length)
+        if with_meta:
+            return password, _password_meta(password, get_char_classes(password))
+        return password
     
     # Build character set based on options
-    charset = ""
-    if use_uppercase:
-        charset += string.ascii_uppercase
-    if use_lowercase:
-        charset += string.ascii_lowercase
-    if use_digits:
-        charset += string.digits
-    if use_special:
-        charset += string.punctuation
+    charset, classes = _charset_for(use_uppercase, use_lowercase, use_digits, use_special)
     
     if not charset:
         raise ValueError("At least one character type must be enabled")
     
-    # Generate password ensuring at least one character from each enabled type
-    password = []
+    result = _assemble_passwords(1, length, charset, classes)[0]
+    if not with_meta:
+        return result
+    
+    # Every enabled class made it in unless length cut the required chars short
+    if length >= len(classes):
+        char_classes = (
+            (CLASS_UPPERCASE if use_uppercase else 0)
+            | (CLASS_LOWERCASE if use_lowercase else 0)
+            | (CLASS_DIGITS if use_digits else 0)
+            | (CLASS_SPECIAL if use_special else 0)
+        )
+    else:
+        char_classes = get_char_classes(result)
+    return result, _password_meta(result, char_classes)
+
+
+# (use_uppercase, use_lowercase, use_digits, use_special) -> (charset, class strings)
+_CHARSET_CACHE: Dict[Tuple[bool, bool, bool, bool], Tuple[str, Tuple[str, ...]]] = {}
+
+
+def _charset_for(
+    use_uppercase: bool,
+    use_lowercase: bool,
+    use_digits: bool,
+    use_special: bool
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Return the charset for a combination of character type options.
+    
+    Each of the 16 combinations is built once and cached.
+    
+    Args:
+        use_uppercase: Include uppercase letters
+        use_lowercase: Include lowercase letters
+        use_digits: Include digits
+        use_special: Include special characters
+    
+    Returns:
+        Tuple of (full charset, the enabled class strings in order)
+    """
+    key = (bool(use_uppercase), bool(use_lowercase), bool(use_digits), bool(use_special))
+    cached = _CHARSET_CACHE.get(key)
+    if cached is None:
+        classes = tuple(
+            chars for enabled, chars in zip(key, (
+                string.ascii_uppercase, string.ascii_lowercase, string.digits, string.punctuation
+            )) if enabled
+        )
+        cached = _CHARSET_CACHE[key] = (''.join(classes), classes)
+    return cached
+
+
+def _assemble_passwords(
+    count: int,
+    length: int,
+    charset: str,
+    classes: Tuple[str, ...]
+) -> List[str]:
+    """
+    Build passwords with one character from each class, the rest from charset.
+    
+    Random characters for all `count` passwords are drawn together, so the
+    number of random reads does not grow with count.
+    
+    Args:
+        count: Number of passwords to build
+        length: Length of each password
+        charset: Characters to fill the rest of each password from
+        classes: Class strings that each password must draw one character from
+    
+    Returns:
+        List of password strings
+    """
+    per_class = len(classes)
+    fill = max(length - per_class, 0)
     
     # Ensure at least one character from each enabled type
-    if use_uppercase:
-        password.append(secrets.choice(string.ascii_uppercase))
-    if use_lowercase:
-        password.append(secrets.choice(string.ascii_lowercase))
-    if use_digits:
-        password.append(secrets.choice(string.digits))
-    if use_special:
-        password.append(secrets.choice(string.punctuation))
+    required = _one_from_each(classes * count)
     
     # Fill the rest randomly
-    remaining_length = length - len(password)
-    if remaining_length > 0:
-        password.extend(secrets.choice(charset) for _ in range(remaining_length))
+    chars = _sample_chars(charset, count * fill) if fill else ''
+    
+    # Place each required character at a uniformly random position. The
+    # fill characters are independent and identically distributed, so this
+    # gives the same distribution as shuffling the whole password while
+    # touching only per_class positions instead of every character
+    source = _random_byte_stream(min(2 * per_class * count, 1 << 16))
+    passwords = []
+    for i in range(count):
+        password = chars[i * fill:(i + 1) * fill]
+        for k, char in enumerate(required[i * per_class:(i + 1) * per_class]):
+            pos = _randbelow_from(fill + k + 1, source)
+            password = password[:pos] + char + password[pos:]
+        passwords.append(password[:length])
+    
+    return passwords
+
+
+def _random_byte_stream(chunk: int) -> Iterator[int]:
+    """
+    Yield random byte values, reading them from the OS chunk bytes at a time.
+    
+    Args:
+        chunk: Number of bytes per read
+    
+    Yields:
+        Integers in range(256)
+    """
+    while True:
+        yield from secrets.token_bytes(chunk)
+
+
+def _randbelow_from(n: int, source: Iterator[int]) -> int:
+    """
+    Draw a uniform integer in range(n), using a random byte stream when n fits.
+    
+    Bytes at or above the largest multiple of n are rejected so the result
+    stays unbiased; n above 256 falls back to secrets.randbelow().
+    
+    Args:
+        n: Exclusive upper bound
+        source: Iterator of random byte values, e.g. _random_byte_stream()
+    
+    Returns:
+        Random integer in range(n)
+    """
+    if n > 256:
+        return secrets.randbelow(n)
+    cutoff = 256 - (256 % n)
+    b = next(source)
+    while b >= cutoff:
+        b = next(source)
+    return b % n
+
+
+def _one_from_each(classes: Tuple[str, ...]) -> List[str]:
+    """
+    Pick one random character from each class string, sharing one random read.
+    
+    Args:
+        classes: Character class strings (each at most 256 characters)
+    
+    Returns:
+        List with one character per class, in order
+    """
+    # Two bytes per class leaves room for rejections; a refill is rare
+    raw = secrets.token_bytes(2 * len(classes))
+    pos = 0
+    picks = []
+    for chars in classes:
+        n = len(chars)
+        cutoff = 256 - (256 % n)
+        while True:
+            if pos == len(raw):
+                raw = secrets.token_bytes(2 * len(classes))
+                pos = 0
+            b = raw[pos]
+            pos += 1
+            if b < cutoff:
+                picks.append(chars[b % n])
+                break
+    return picks
+
+
+@functools.lru_cache(maxsize=32)
+def _byte_table(charset: str) -> Tuple[bytes, bytes]:
+    """
+    Build a bytes.translate() table mapping random bytes onto a charset.
+    
+    ASCII charsets map straight to character codes; other charsets map to
+    indices into the charset.
+    
+    Args:
+        charset: Characters to sample from (at most 256)
+    
+    Returns:
+        Tuple of (translation table, bytes to delete as rejected)
+    """
+    n = len(charset)
+    cutoff = 256 - (256 % n)
+    if charset.isascii():
+        table = bytes(ord(charset[b % n]) if b < cutoff else 0 for b in range(256))
+    else:
+        table = bytes(b % n if b < cutoff else 0 for b in range(256))
+    return table, bytes(range(cutoff, 256))
+
+
+def _sample_chars(charset: str, k: int) -> str:
+    """
+    Draw k characters uniformly from charset using bulk random reads.
+    
+    Random bytes are mapped to characters by modulo, rejecting bytes above
+    the largest multiple of len(charset) so the result stays unbiased. The
+    mapping and rejection run in one bytes.translate() pass; when
+    len(charset) divides 256 nothing is rejected at all.
+    
+    Args:
+        charset: Characters to sample from
+        k: Number of characters to draw
+    
+    Returns:
+        String of k random characters
+    """
+    if len(charset) > 256:
+        return ''.join(secrets.choice(charset) for _ in range(k))
+    
+    table, rejected = _byte_table(charset)
+    cutoff = 256 - len(rejected)
+    out = b''
+    while len(out) < k:
+        need = k - len(out)
+        # Oversample by 25% over the expected acceptance rate so one read
+        # almost always suffices; exact when len(charset) divides 256
+        draw = need if cutoff == 256 else -(-need * 320 // cutoff)
+        out += secrets.token_bytes(draw).translate(table, rejected)
+    
+    if charset.isascii():
+        return out[:k].decode('ascii')
+    return ''.join(map(charset.__getitem__, out[:k]))
+
+
+def generate_passwords_batch(count: int, length: int, alphabet: str) -> List[str]:
+    """
+    Generate many passwords from one alphabet with a single random read.
+    
+    Unlike generate_password(), characters are drawn uniformly from the
+    alphabet with no per-class guarantees, and duplicates are not removed.
+    
+    Args:
+        count: Number of passwords to generate
+        length: Length of each password
+        alphabet: Characters to draw from
+    
+    Returns:
+        List of password strings
+        
+    Raises:
+        ValueError: If count < 1, length < 1 or the alphabet is empty
+    """
+    if count < 1:
+        raise ValueError("Count must be at least 1")
+    if length < 1:
+        raise ValueError("Password length must be at least 1")
+    if not alphabet:
+        raise ValueError("Alphabet cannot be empty")
+    
+    chars = _sample_chars(alphabet, count * length)
+    return [chars[i:i + length] for i in range(0, count * length, length)]
+
+
+def _generate_many(
+    count: int,
+    length: int,
+    use_uppercase: bool = True,
+    use_lowercase: bool = True,
+    use_digits: bool = True,
+    use_special: bool = True,
+    custom_chars: Optional[str] = None
+) -> List[str]:
+    """
+    Generate count passwords as generate_password() would, sharing random reads.
+    
+    Args:
+        count: Number of passwords to generate
+        length: Length of each password
+        use_uppercase: Include uppercase letters
+        use_lowercase: Include lowercase letters
+        use_digits: Include digits
+        use_special: Include special characters
+        custom_chars: Custom character set to use (overrides other options)
+    
+    Returns:
+        List of password strings (duplicates are not removed)
+        
+    Raises:
+        ValueError: If length < 1 or no character types are selected
+    """
+    if length < 1:
+        raise ValueError("Password length must be at least 1")
     
-    # Shuffle to avoid predictable patterns
-    password_list = list(password)
-    for i in range(len(password_list) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
-        password_list[i], password_list[j] = password_list[j], password_list[i]
+    if custom_chars:
+        return generate_passwords_batch(count, length, custom_chars)
+    
+    charset, classes = _charset_for(use_uppercase, use_lowercase, use_digits, use_special)
+    if not charset:
+        raise ValueError("At least one character type must be enabled")
+    
+    return _assemble_passwords(count, length, charset, classes)
+
+
+def _required_classes(
+    use_uppercase: bool = True,
+    use_lowercase: bool = True,
+    use_digits: bool = True,
+    use_special: bool = True,
+    custom_chars: Optional[str] = None
+) -> Tuple[str, ...]:
+    """
+    Return the classes a password must draw one character from.
+    
+    Takes the same options as _generate_many(); a custom character set is
+    a single class.
+    
+    Returns:
+        Tuple of class strings (empty if no character types are selected)
+    """
+    if custom_chars:
+        return (custom_chars,)
+    return _charset_for(use_uppercase, use_lowercase, use_digits, use_special)[1]
+
+
+def _keyspace(length: int, classes: Tuple[str, ...]) -> int:
+    """
+    Count the distinct passwords _assemble_passwords() can produce.
+    
+    With at least one character per class this is, by inclusion-exclusion
+    over the classes a password could miss, the sum of
+    (-1)**|S| * (alphabet size - sizes of S)**length. When length is shorter
+    than the number of classes, each character comes from a different
+    class, giving length! times the sum of products of `length` class sizes.
+    
+    Args:
+        length: Password length (at least 1)
+        classes: Disjoint class strings
+    
+    Returns:
+        Number of possible passwords
+    """
+    sizes = [len(set(chars)) for chars in classes]
+    
+    if length < len(sizes):
+        total = 0
+        for combo in itertools.combinations(sizes, length):
+            product = 1
+            for size in combo:
+                product *= size
+            total += product
+        return math.factorial(length) * total
+    
+    alphabet = sum(sizes)
+    total = 0
+    for r in range(len(sizes) + 1):
+        for missed in itertools.combinations(sizes, r):
+            total += (-1) ** r * (alphabet - sum(missed)) ** length
+    return total
+
+
+def _check_keyspace(count: int, length: int, classes: Tuple[str, ...]) -> None:
+    """
+    Make sure count distinct passwords can exist, so deduplication ends.
+    
+    Args:
+        count: Number of unique passwords wanted
+        length: Password length
+        classes: Classes each password draws one character from
+    
+    Raises:
+        ValueError: If fewer than count distinct passwords are possible
+    """
+    if not classes or length < 1:
+        return
     
-    return ''.join(password_list[:length])
+    # Each position can take at least the smallest class, so smallest**length
+    # bounds the keyspace from below; only small keyspaces need the exact,
+    # big-integer count
+    smallest = min(len(set(chars)) for chars in classes)
+    if smallest > 1 and length * math.log2(smallest) >= math.log2(count):
+        return
+    
+    possible = _keyspace(length, classes)
+    if possible < count:
+        raise ValueError(f"Cannot generate {count} unique passwords: only {possible} exist")
 
 
 def generate_multiple_passwords(
@@ -116,16 +513,144 @@ def generate_multiple_passwords(
         List of unique password strings
         
     Raises:
-        ValueError: If count < 1
+        ValueError: If count < 1, or count exceeds the number of distinct
+            passwords the options allow
     """
     if count < 1:
         raise ValueError("Count must be at least 1")
     
-    passwords: Set[str] = set()
-    while len(passwords) < count:
-        passwords.add(generate_password(length=length, **kwargs))
+    passwords = _generate_many(count, length, **kwargs)
+    return _dedupe(
+        passwords,
+        lambda: generate_password(length=length, **kwargs),
+        length,
+        _required_classes(**kwargs)
+    )
+
+
+def iter_passwords(
+    count: int,
+    length: int = 16,
+    batch_size: int = 256,
+    unique: bool = True,
+    **kwargs
+) -> Iterator[str]:
+    """
+    Yield passwords one at a time, generating them in batches.
+    
+    A lazy counterpart to generate_multiple_passwords() for large counts:
+    only one batch of passwords is held at a time, plus (when unique) the
+    set of those already yielded.
+    
+    Args:
+        count: Number of passwords to yield
+        length: Length of each password
+        batch_size: Passwords generated per bulk random read
+        unique: Skip passwords that were already yielded
+        **kwargs: Additional arguments passed to generate_password()
+    
+    Yields:
+        Password strings, count in total
+        
+    Raises:
+        ValueError: If count < 1, batch_size < 1, or unique is set and count
+            exceeds the number of distinct passwords the options allow
+    """
+    if count < 1:
+        raise ValueError("Count must be at least 1")
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    
+    if not unique:
+        remaining = count
+        while remaining > 0:
+            batch = min(remaining, batch_size)
+            yield from _generate_many(batch, length, **kwargs)
+            remaining -= batch
+        return
+    
+    _check_keyspace(count, length, _required_classes(**kwargs))
+    
+    seen: Set[str] = set()
+    remaining = count
+    while remaining > 0:
+        for password in _generate_many(min(remaining, batch_size), length, **kwargs):
+            if password not in seen:
+                seen.add(password)
+                remaining -= 1
+                yield password
+
+
+def generate_multiple_passwords_custom(
+    count: int,
+    length: int,
+    custom_chars: str
+) -> List[str]:
+    """
+    Generate multiple unique passwords from a custom character set.
+    
+    Equivalent to generate_multiple_passwords(custom_chars=...), without
+    the character-type options that a custom set overrides anyway.
     
-    return list(passwords)
+    Args:
+        count: Number of passwords to generate
+        length: Length of each password
+        custom_chars: Characters to draw from
+    
+    Returns:
+        List of unique password strings
+        
+    Raises:
+        ValueError: If count < 1, length < 1, custom_chars is empty, or
+            count exceeds the number of distinct passwords it allows
+    """
+    passwords = generate_passwords_batch(count, length, custom_chars)
+    return _dedupe(
+        passwords,
+        lambda: _sample_chars(custom_chars, length),
+        length,
+        (custom_chars,)
+    )
+
+
+def _dedupe(
+    passwords: List[str],
+    make_one,
+    length: int,
+    classes: Tuple[str, ...]
+) -> List[str]:
+    """
+    Remove duplicates from passwords, topping up with make_one() to keep the count.
+    
+    Args:
+        passwords: Generated passwords, possibly with duplicates
+        make_one: Callable returning one new password
+        length: Length of each password
+        classes: Classes each password draws one character from
+    
+    Returns:
+        List of unique password strings, as many as were passed in
+        
+    Raises:
+        ValueError: If fewer distinct passwords exist than were passed in
+    """
+    # Collisions are vanishingly rare unless the keyspace is tiny (short or
+    # single-class passwords), so only then fall back to topping up
+    unique = list(dict.fromkeys(passwords))
+    if len(unique) == len(passwords):
+        return passwords
+    
+    # Topping up would never finish if the keyspace is smaller than count
+    _check_keyspace(len(passwords), length, classes)
+    
+    seen: Set[str] = set(unique)
+    while len(unique) < len(passwords):
+        password = make_one()
+        if password not in seen:
+            seen.add(password)
+            unique.append(password)
+    
+    return unique
 
 
 def generate_passphrase(
@@ -160,10 +685,7 @@ def generate_passphrase(
     # Import wordlist here to avoid circular dependency
     from source.wordlist import get_random_words
     
-    words = get_random_words(word_count)
-    
-    if capitalize:
-        words = [word.capitalize() for word in words]
+    words = get_random_words(word_count, capitalize=capitalize)
     
     passphrase = separator.join(words)
     
@@ -174,6 +696,68 @@ def generate_passphrase(
     return passphrase
 
 
+def _randbelow_batch(n: int, k: int) -> List[int]:
+    """
+    Draw k integers uniformly from range(n) using bulk random reads.
+    
+    Args:
+        n: Exclusive upper bound (at most 256)
+        k: Number of integers to draw
+    
+    Returns:
+        List of k random integers
+    """
+    cutoff = 256 - (256 % n)
+    values: List[int] = []
+    while len(values) < k:
+        raw = secrets.token_bytes((k - len(values)) * 2)
+        values.extend(b % n for b in raw if b < cutoff)
+    
+    return values[:k]
+
+
+def generate_passphrases_batch(
+    count: int,
+    word_count: int = 4,
+    separator: str = "-",
+    capitalize: bool = True,
+    include_number: bool = False
+) -> List[str]:
+    """
+    Generate many passphrases, sampling all their words in one call.
+    
+    Args:
+        count: Number of passphrases to generate
+        word_count: Number of words in each passphrase (default: 4)
+        separator: Character(s) to separate words (default: "-")
+        capitalize: Capitalize first letter of each word (default: True)
+        include_number: Append a random number to each passphrase (default: False)
+    
+    Returns:
+        List of passphrases (duplicates are not removed)
+        
+    Raises:
+        ValueError: If count < 1 or word_count < 1
+    """
+    if count < 1:
+        raise ValueError("Count must be at least 1")
+    if word_count < 1:
+        raise ValueError("Word count must be at least 1")
+    
+    from source.wordlist import get_random_words
+    
+    total = count * word_count
+    words = get_random_words(total, capitalize=capitalize)
+    
+    passphrases = [separator.join(words[i:i + word_count]) for i in range(0, total, word_count)]
+    
+    if include_number:
+        numbers = _randbelow_batch(100, count)
+        passphrases = [f"{phrase}{separator}{number}" for phrase, number in zip(passphrases, numbers)]
+    
+    return passphrases
+
+
 def random_password_generator() -> str:
     """
     Legacy function for backward compatibility.
@@ -231,6 +815,7 @@ def generate_hex_key(length: int = 32) -> str:
         length: Length of the hex key (default: 32)
     
     Returns:
-        A randomly generated hex string
+        A randomly generated hex string of exactly `length` characters
     """
-    return secrets.token_hex(length // 2)
+    # Round odd lengths up to whole bytes, then drop the extra digit
+    return secrets.token_bytes((length + 1) >> 1).hex()[:length]
@@ -8,12 +8,12 @@ Analyzes password strength based on entropy, character diversity, and common pat
 
 import math
 import string
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 
 
 # Common weak passwords (top 100 most common)
-COMMON_PASSWORDS = {
+COMMON_PASSWORDS = frozenset({
     'password', '123456', '12345678', 'qwerty', 'abc123', 'monkey', '1234567',
     'letmein', 'trustno1', 'dragon', 'baseball', 'iloveyou', 'master', 'sunshine',
     'ashley', 'bailey', 'passw0rd', 'shadow', '123123', '654321', 'superman',
@@ -22,15 +22,88 @@ COMMON_PASSWORDS = {
     'admin', 'root', 'toor', 'pass', 'test', 'guest', 'info', 'adm', 'mysql',
     'user', 'administrator', 'oracle', 'ftp', 'pi', 'puppet', 'ansible', 'ec2-user',
     'vagrant', 'azureuser', 'qwerty123', 'password123', 'admin123'
+})
+
+# Bits of the character class mask returned by get_char_classes()
+CLASS_UPPERCASE = 1
+CLASS_LOWERCASE = 2
+CLASS_DIGITS = 4
+CLASS_SPECIAL = 8
+
+# Case-insensitive patterns, searched together in one pass over the lowercased password
+_RE_LOWER_PATTERNS = re.compile(
+    r'(?P<sequential>abc|bcd|cde|123|234|345|456|567|678|789)'
+    r'|(?P<keyboard>qwerty|asdfgh|zxcvbn)'
+)
+_RE_REPEAT = re.compile(r'(.)\1{2,}')
+
+
+def _classify_byte(b: int) -> int:
+    """
+    Return the CLASS_* bit for a byte value, or 0 if it is in no class.
+    
+    Args:
+        b: Byte value (0-255)
+    
+    Returns:
+        One of the CLASS_* constants, or 0
+    """
+    return (
+        (CLASS_UPPERCASE if 65 <= b <= 90 else 0)       # A-Z
+        | (CLASS_LOWERCASE if 97 <= b <= 122 else 0)    # a-z
+        | (CLASS_DIGITS if 48 <= b <= 57 else 0)        # 0-9
+        | (CLASS_SPECIAL if 33 <= b <= 47 or 58 <= b <= 64
+           or 91 <= b <= 96 or 123 <= b <= 126 else 0)  # string.punctuation
+    )
+
+
+# bytes.translate() table mapping each byte to its character class bit
+_CLASS_TABLE = bytes(_classify_byte(b) for b in range(256))
+
+# Character pool size contributed by each class
+_POOL_SIZES = {
+    CLASS_UPPERCASE: 26,
+    CLASS_LOWERCASE: 26,
+    CLASS_DIGITS: 10,
+    CLASS_SPECIAL: len(string.punctuation),
 }
 
+# log2 of the pool size for every class mask (0.0 for an empty pool)
+_POOL_LOG2 = tuple(
+    math.log2(pool) if pool else 0.0
+    for pool in (
+        sum(size for bit, size in _POOL_SIZES.items() if mask & bit)
+        for mask in range(16)
+    )
+)
+
 
-def calculate_entropy(password: str) -> float:
+def get_char_classes(password: str) -> int:
+    """
+    Determine which character classes a password uses, in a single pass.
+    
+    Args:
+        password: The password to analyze
+    
+    Returns:
+        Bitmask of CLASS_UPPERCASE, CLASS_LOWERCASE, CLASS_DIGITS and CLASS_SPECIAL
+    """
+    # Every class is ASCII, so non-ASCII bytes (all >= 0x80) map to 0
+    classes = password.encode('utf-8', 'ignore').translate(_CLASS_TABLE)
+    mask = 0
+    for bit in (CLASS_UPPERCASE, CLASS_LOWERCASE, CLASS_DIGITS, CLASS_SPECIAL):
+        if bit in classes:
+            mask |= bit
+    return mask
+
+
+def calculate_entropy(password: str, char_classes: Optional[int] = None) -> float:
     """
     Calculate the entropy (randomness) of a password in bits.
     
     Args:
         password: The password to analyze
+        char_classes: Precomputed get_char_classes() mask, if already known
     
     Returns:
         Entropy value in bits
@@ -39,32 +112,43 @@ def calculate_entropy(password: str) -> float:
         return 0.0
     
     # Determine character pool size
-    pool_size = 0
-    
-    if any(c in string.ascii_lowercase for c in password):
-        pool_size += 26
-    if any(c in string.ascii_uppercase for c in password):
-        pool_size += 26
-    if any(c in string.digits for c in password):
-        pool_size += 10
-    if any(c in string.punctuation for c in password):
-        pool_size += len(string.punctuation)
+    if char_classes is None:
+        char_classes = get_char_classes(password)
     
     # Calculate entropy: log2(pool_size ^ length)
-    if pool_size > 0:
-        entropy = len(password) * math.log2(pool_size)
-    else:
-        entropy = 0.0
+    return len(password) * _POOL_LOG2[char_classes]
+
+
+def analyze_batch(passwords: Iterable[str]) -> List[Tuple[float, int]]:
+    """
+    Compute entropy and character classes for many passwords at once.
+    
+    Cheaper than calling analyze_password_strength() per password when only
+    entropy and composition are needed, e.g. when auditing a large list.
+    
+    Args:
+        passwords: Passwords to analyze
     
-    return entropy
+    Returns:
+        List of (entropy in bits, get_char_classes() mask) tuples, in input order
+    """
+    classify = get_char_classes
+    pool_log2 = _POOL_LOG2
+    results = []
+    for password in passwords:
+        char_classes = classify(password)
+        results.append((len(password) * pool_log2[char_classes], char_classes))
+    return results
 
 
-def analyze_password_strength(password: str) -> Dict[str, any]:
+def analyze_password_strength(password: str, char_classes: Optional[int] = None) -> Dict[str, any]:
     """
     Comprehensive password strength analysis.
     
     Args:
         password: The password to analyze
+        char_classes: Precomputed get_char_classes() mask, if already known
+            (e.g. from rpg.generate_password(with_meta=True))
     
     Returns:
         Dictionary containing:
@@ -76,6 +160,7 @@ def analyze_password_strength(password: str) -> Dict[str, any]:
             - has_lowercase: Boolean
             - has_digits: Boolean
             - has_special: Boolean
+            - char_classes: Bitmask of the character classes above (CLASS_* constants)
             - is_common: Boolean (found in common passwords list)
             - feedback: List of improvement suggestions
     """
@@ -89,24 +174,30 @@ def analyze_password_strength(password: str) -> Dict[str, any]:
             'has_lowercase': False,
             'has_digits': False,
             'has_special': False,
+            'char_classes': 0,
             'is_common': False,
             'feedback': ['Password cannot be empty']
         }
     
     # Character type checks
-    has_uppercase = any(c in string.ascii_uppercase for c in password)
-    has_lowercase = any(c in string.ascii_lowercase for c in password)
-    has_digits = any(c in string.digits for c in password)
-    has_special = any(c in string.punctuation for c in password)
+    if char_classes is None:
+        char_classes = get_char_classes(password)
+    has_uppercase = bool(char_classes & CLASS_UPPERCASE)
+    has_lowercase = bool(char_classes & CLASS_LOWERCASE)
+    has_digits = bool(char_classes & CLASS_DIGITS)
+    has_special = bool(char_classes & CLASS_SPECIAL)
     
     # Length check
     length = len(password)
     
-    # Common password check
-    is_common = password.lower() in COMMON_PASSWORDS
+    # Lowercased once for the common-password and pattern checks
+    pwd_lower = password if password.islower() else password.lower()
+    
+    # Common password check (the list is all ASCII; isascii() is O(1) in CPython)
+    is_common = pwd_lower.isascii() and pwd_lower in COMMON_PASSWORDS
     
     # Calculate entropy
-    entropy = calculate_entropy(password)
+    entropy = calculate_entropy(password, char_classes)
     
     # Calculate base score
     score = 0
@@ -159,18 +250,24 @@ def analyze_password_strength(password: str) -> Dict[str, any]:
         score += 5
     
     # Pattern penalties
+    found = set()
+    for match in _RE_LOWER_PATTERNS.finditer(pwd_lower):
+        found.add(match.lastgroup)
+        if len(found) == 2:
+            break
+    
     # Sequential characters
-    if re.search(r'(abc|bcd|cde|123|234|345|456|567|678|789)', password.lower()):
+    if 'sequential' in found:
         score -= 10
         feedback.append("Avoid sequential characters (abc, 123)")
     
     # Repeated characters
-    if re.search(r'(.)\1{2,}', password):
+    if _RE_REPEAT.search(password):
         score -= 10
         feedback.append("Avoid repeated characters (aaa, 111)")
     
     # Keyboard patterns
-    if re.search(r'(qwerty|asdfgh|zxcvbn)', password.lower()):
+    if 'keyboard' in found:
         score -= 15
         feedback.append("Avoid keyboard patterns (qwerty, asdf)")
     
@@ -211,6 +308,7 @@ def analyze_password_strength(password: str) -> Dict[str, any]:
         'has_lowercase': has_lowercase,
         'has_digits': has_digits,
         'has_special': has_special,
+        'char_classes': char_classes,
         'is_common': is_common,
         'feedback': feedback if feedback else ['Great password!']
     }
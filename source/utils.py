@@ -10,21 +10,152 @@ import json
 import csv
 import hashlib
 import os
+import sys
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 
 
+def _copy_windows(text: str) -> bool:
+    """
+    Copy text to the Windows clipboard through the Win32 API (ctypes).
+    
+    Args:
+        text: Text to copy
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+    
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.CloseClipboard.restype = wintypes.BOOL
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    
+    data = text.encode('utf-16-le') + b'\x00\x00'
+    
+    if not user32.OpenClipboard(None):
+        return False
+    
+    try:
+        user32.EmptyClipboard()
+        
+        handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(pointer, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        
+        # On success the clipboard owns the memory
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
+
+
+def _copy_darwin(text: str) -> bool:
+    """
+    Copy text to the macOS pasteboard through the Objective-C runtime (ctypes).
+    
+    Args:
+        text: Text to copy
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    import ctypes
+    import ctypes.util
+    
+    objc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('objc'))
+    ctypes.cdll.LoadLibrary('/System/Library/Frameworks/AppKit.framework/AppKit')
+    
+    objc.objc_getClass.argtypes = [ctypes.c_char_p]
+    objc.objc_getClass.restype = ctypes.c_void_p
+    objc.sel_registerName.argtypes = [ctypes.c_char_p]
+    objc.sel_registerName.restype = ctypes.c_void_p
+    
+    # objc_msgSend must be called through a prototype matching each message
+    msg_send = ctypes.cast(objc.objc_msgSend, ctypes.c_void_p).value
+    send = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)(msg_send)
+    send_str = ctypes.CFUNCTYPE(
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p
+    )(msg_send)
+    send_set = ctypes.CFUNCTYPE(
+        ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p
+    )(msg_send)
+    
+    def cls(name: bytes) -> int:
+        return objc.objc_getClass(name)
+    
+    def sel(name: bytes) -> int:
+        return objc.sel_registerName(name)
+    
+    pool = send(send(cls(b'NSAutoreleasePool'), sel(b'alloc')), sel(b'init'))
+    try:
+        pasteboard = send(cls(b'NSPasteboard'), sel(b'generalPasteboard'))
+        send(pasteboard, sel(b'clearContents'))
+        
+        string_with_utf8 = sel(b'stringWithUTF8String:')
+        ns_text = send_str(cls(b'NSString'), string_with_utf8, text.encode('utf-8'))
+        ns_type = send_str(cls(b'NSString'), string_with_utf8, b'public.utf8-plain-text')
+        
+        return bool(send_set(pasteboard, sel(b'setString:forType:'), ns_text, ns_type))
+    finally:
+        send(pool, sel(b'drain'))
+
+
+# Native clipboard access for this platform (None: use pyperclip)
+if sys.platform == 'win32':
+    _native_copy = _copy_windows
+elif sys.platform == 'darwin':
+    _native_copy = _copy_darwin
+else:
+    _native_copy = None
+
+
 def copy_to_clipboard(text: str) -> bool:
     """
     Copy text to system clipboard.
     
+    Uses the native clipboard API on Windows and macOS, and pyperclip on
+    other platforms or if the native call fails.
+    
     Args:
         text: Text to copy
     
     Returns:
         True if successful, False otherwise
     """
+    if _native_copy is not None:
+        try:
+            if _native_copy(text):
+                return True
+        except Exception:
+            pass
+    
     try:
         import pyperclip
         pyperclip.copy(text)
@@ -117,12 +248,11 @@ def export_passwords_csv(passwords: List[str], filename: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        timestamp = datetime.now().isoformat()
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
             writer = csv.writer(f)
-            writer.writerow(['Password', 'Generated At'])
-            timestamp = datetime.now().isoformat()
-            for pwd in passwords:
-                writer.writerow([pwd, timestamp])
+            writer.writerow(('Password', 'Generated At'))
+            writer.writerows((pwd, timestamp) for pwd in passwords)
         
         print(f"✓ Passwords exported to: {filename}")
         return True
@@ -143,11 +273,14 @@ def export_passwords_txt(passwords: List[str], filename: str) -> bool:
         True if successful, False otherwise
     """
     try:
+        header = (
+            f"# Generated Passwords - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"# Total: {len(passwords)}\n\n"
+        )
+        # Trailing '' gives every password, and only passwords, a newline
+        body = '\n'.join([*passwords, ''])
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"# Generated Passwords - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Total: {len(passwords)}\n\n")
-            for pwd in passwords:
-                f.write(f"{pwd}\n")
+            f.write(header + body)
         
         print(f"✓ Passwords exported to: {filename}")
         return True
@@ -183,18 +316,101 @@ def export_passwords(passwords: List[str], filename: str) -> bool:
 
 def hash_password(password: str) -> str:
     """
-    Create a SHA-256 hash of a password (for history tracking).
+    Create a BLAKE2b hash of a password (for history tracking).
     
     Args:
         password: Password to hash
     
     Returns:
-        Hexadecimal hash string
+        Hexadecimal hash string (32 characters)
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return hashlib.blake2b(password.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# Default history file: newline-delimited JSON, one entry per line
+HISTORY_FILE = '.rpg_history.ndjson'
 
+# Entries kept when the history is compacted, and the size that triggers it
+_HISTORY_KEEP = 100
+_HISTORY_COMPACT_AT = 200
 
-def save_to_history(password: str, history_file: str = '.rpg_history.json') -> bool:
+
+def _read_legacy_history(path: str) -> Optional[list]:
+    """
+    Read the entries of a pre-NDJSON history file.
+    
+    Args:
+        path: Path to an existing history file
+    
+    Returns:
+        List of entries if the file holds a single JSON document (the old
+        format), or None if it is empty or already NDJSON
+    
+    Raises:
+        ValueError: If the file looks like an old-format document but
+            cannot be parsed
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.readline()
+        if not first.lstrip().startswith(('{', '[')):
+            return None
+        
+        # An NDJSON file starts with a complete entry on its own line
+        try:
+            entry = json.loads(first)
+            if isinstance(entry, dict) and 'hash' in entry:
+                return None
+        except ValueError:
+            pass
+        
+        f.seek(0)
+        data = json.load(f)
+    
+    return list(data.get('passwords', []) if isinstance(data, dict) else data)
+
+
+def _migrate_legacy_history(history_file: str) -> bool:
+    """
+    Convert a pre-NDJSON history to NDJSON the first time it is used.
+    
+    Older versions kept the history as a single JSON document, by default
+    in '.rpg_history.json'. If history_file holds such a document, whatever
+    its extension, it is rewritten as NDJSON in place. If history_file is a
+    missing '.ndjson' file and its '.json' sibling holds one, the entries
+    are copied over and the old file is left untouched. Only the last
+    _HISTORY_KEEP entries are kept.
+    
+    Args:
+        history_file: Path to the history file
+    
+    Returns:
+        False if an old-format document could not be read (it is left as is
+        and must not be appended to), True otherwise
+    """
+    root, ext = os.path.splitext(history_file)
+    if os.path.exists(history_file):
+        legacy_file = history_file
+    elif ext == '.ndjson' and os.path.exists(root + '.json'):
+        legacy_file = root + '.json'
+    else:
+        return True
+    
+    try:
+        entries = _read_legacy_history(legacy_file)
+        if entries is None:
+            return True
+        
+        temp_file = history_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(entry) + '\n' for entry in entries[-_HISTORY_KEEP:])
+        os.replace(temp_file, history_file)
+        return True
+    except (OSError, TypeError, ValueError, AttributeError) as e:
+        print(f"⚠️  Failed to migrate history from {legacy_file}: {e}")
+        return False
+
+
+def save_to_history(password: str, history_file: str = HISTORY_FILE) -> bool:
     """
     Save password hash to history file (for tracking, not storing actual passwords).
     
@@ -205,30 +421,49 @@ def save_to_history(password: str, history_file: str = '.rpg_history.json') -> b
     Returns:
         True if successful, False otherwise
     """
+    return save_to_history_batch([password], history_file)
+
+
+def save_to_history_batch(passwords: List[str], history_file: str = HISTORY_FILE) -> bool:
+    """
+    Append hashes of several passwords to the history file.
+    
+    Entries are appended without reading the whole file. Once it grows past
+    about _HISTORY_COMPACT_AT entries it is rewritten with only the last
+    _HISTORY_KEEP.
+    
+    Args:
+        passwords: Passwords to add to history
+        history_file: Path to history file
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    if not passwords:
+        return True
+    
+    if not _migrate_legacy_history(history_file):
+        return False
+    
     try:
-        # Load existing history
-        if os.path.exists(history_file):
-            with open(history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-        else:
-            history = {'passwords': []}
-        
-        # Add new entry
-        entry = {
-            'hash': hash_password(password),
-            'length': len(password),
-            'generated_at': datetime.now().isoformat()
-        }
-        
-        history['passwords'].append(entry)
+        generated_at = datetime.now().isoformat()
+        lines = ''.join(
+            json.dumps({
+                'hash': hash_password(password),
+                'length': len(password),
+                'generated_at': generated_at
+            }) + '\n'
+            for password in passwords
+        )
         
-        # Keep only last 100 entries
-        if len(history['passwords']) > 100:
-            history['passwords'] = history['passwords'][-100:]
+        with open(history_file, 'a', encoding='utf-8') as f:
+            f.write(lines)
         
-        # Save updated history
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2)
+        # Entries are all about the same size, so the file size tells when
+        # compaction is due without reading the file
+        entry_size = len(lines) / len(passwords)
+        if os.path.getsize(history_file) > _HISTORY_COMPACT_AT * entry_size:
+            _compact_history(history_file)
         
         return True
     except Exception as e:
@@ -236,7 +471,22 @@ def save_to_history(password: str, history_file: str = '.rpg_history.json') -> b
         return False
 
 
-def check_history(password: str, history_file: str = '.rpg_history.json') -> bool:
+def _compact_history(history_file: str) -> None:
+    """
+    Rewrite the history file keeping only the last _HISTORY_KEEP entries.
+    
+    Args:
+        history_file: Path to history file
+    """
+    with open(history_file, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    
+    if len(lines) > _HISTORY_KEEP:
+        with open(history_file, 'w', encoding='utf-8') as f:
+            f.writelines(lines[-_HISTORY_KEEP:])
+
+
+def check_history(password: str, history_file: str = HISTORY_FILE) -> bool:
     """
     Check if a password (hash) exists in history.
     
@@ -247,19 +497,28 @@ def check_history(password: str, history_file: str = '.rpg_history.json') -> boo
     Returns:
         True if password found in history, False otherwise
     """
+    if not _migrate_legacy_history(history_file):
+        return False
+    
     try:
         if not os.path.exists(history_file):
             return False
         
         with open(history_file, 'r', encoding='utf-8') as f:
-            history = json.load(f)
+            hashes = {json.loads(line)['hash'] for line in f if line.strip()}
         
-        pwd_hash = hash_password(password)
-        return any(entry['hash'] == pwd_hash for entry in history.get('passwords', []))
+        if hash_password(password) in hashes:
+            return True
+        
+        # Entries written before the switch to BLAKE2b hold SHA-256 digests
+        return hashlib.sha256(password.encode()).hexdigest() in hashes
     except Exception:
         return False
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_size_bytes(size_bytes: int) -> str:
     """
     Format byte size to human-readable string.
@@ -270,8 +529,8 @@ def format_size_bytes(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 KB", "2.3 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Each unit spans 10 bits; sizes past TB stay in TB
+    unit = 0
+    if size_bytes >= 1:
+        unit = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
@@ -6,13 +6,14 @@ Wordlist Module for Passphrase Generation
 Contains EFF's long wordlist for secure, memorable passphrase generation.
 """
 
+import math
 import secrets
 from typing import List
 
 
 # EFF's Long Wordlist (subset - full list has 7776 words)
 # These are carefully selected words that are easy to type and remember
-EFF_WORDLIST = [
+EFF_WORDLIST = (
     # A-C
     "abacus", "abdomen", "abdominal", "abide", "abiding", "ability", "ablaze", "able",
     "abnormal", "abrasion", "abrasive", "abreast", "abridge", "abroad", "abruptly",
@@ -83,15 +84,47 @@ EFF_WORDLIST = [
     "zebra", "zenith", "zeppelin", "zero", "zest", "zigzag", "zipfile", "zipper",
     "zipping", "zirconium", "zodiac", "zombie", "zone", "zoning", "zookeeper", "zoologist",
     "zoology", "zoom", "zucchini"
-]
+)
 
+# Capitalized copy of the wordlist, in the same order
+EFF_WORDLIST_CAP = tuple(word.capitalize() for word in EFF_WORDLIST)
 
-def get_random_words(count: int = 4) -> List[str]:
+_WORDLIST_LEN = len(EFF_WORDLIST)
+_WORDLIST_LOG2 = math.log2(_WORDLIST_LEN)
+
+# Largest multiple of the wordlist size that fits in 16 bits; random
+# 16-bit values at or above it are rejected to keep indices unbiased
+_INDEX_CUTOFF = 65536 - 65536 % _WORDLIST_LEN
+
+
+def _random_indices(count: int) -> List[int]:
+    """
+    Draw count uniform wordlist indices from bulk random reads.
+    
+    Args:
+        count: Number of indices to draw
+    
+    Returns:
+        List of integers in range(len(EFF_WORDLIST))
+    """
+    indices: List[int] = []
+    while len(indices) < count:
+        need = count - len(indices)
+        # Two bytes per index, plus 25% headroom over the acceptance rate
+        raw = secrets.token_bytes(2 * -(-need * 81920 // _INDEX_CUTOFF))
+        indices.extend(v % _WORDLIST_LEN for v in memoryview(raw).cast('H') if v < _INDEX_CUTOFF)
+    
+    del indices[count:]
+    return indices
+
+
+def get_random_words(count: int = 4, capitalize: bool = False) -> List[str]:
     """
     Get random words from the EFF wordlist.
     
     Args:
         count: Number of words to retrieve
+        capitalize: Return words with their first letter capitalized
     
     Returns:
         List of random words
@@ -102,7 +135,8 @@ def get_random_words(count: int = 4) -> List[str]:
     if count < 1:
         raise ValueError("Count must be at least 1")
     
-    return [secrets.choice(EFF_WORDLIST) for _ in range(count)]
+    words = EFF_WORDLIST_CAP if capitalize else EFF_WORDLIST
+    return list(map(words.__getitem__, _random_indices(count)))
 
 
 def get_wordlist_size() -> int:
@@ -112,7 +146,7 @@ def get_wordlist_size() -> int:
     Returns:
         Number of words in the wordlist
     """
-    return len(EFF_WORDLIST)
+    return _WORDLIST_LEN
 
 
 def calculate_passphrase_entropy(word_count: int) -> float:
@@ -125,5 +159,4 @@ def calculate_passphrase_entropy(word_count: int) -> float:
     Returns:
         Entropy in bits
     """
-    import math
-    return word_count * math.log2(len(EFF_WORDLIST))
+    return word_count * _WORDLIST_LOG2
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for RPG command-line argument parsing.
+"""
+
+import string
+import unittest
+from source import cli
+
+
+class TestFastParse(unittest.TestCase):
+    """Test the argparse-free fast path."""
+    
+    def test_fast_path_matches_argparse(self):
+        """Test that fast-parsed arguments equal the full parser's result."""
+        for argv in ([], ['-l', '20'], ['--length', '8'], ['-c', '3'], ['--count', '5']):
+            with self.subTest(argv=argv):
+                fast = cli._parse_fast(argv)
+                self.assertIsNotNone(fast)
+                self.assertEqual(vars(fast), vars(cli._build_parser().parse_args(argv)))
+    
+    def test_fast_path_falls_back(self):
+        """Test that other invocations are left to argparse."""
+        for argv in (['-l', 'abc'], ['-l'], ['--passphrase'], ['-l', '20', '-c', '2']):
+            with self.subTest(argv=argv):
+                self.assertIsNone(cli._parse_fast(argv))
+
+
+class TestIterPasswords(unittest.TestCase):
+    """Test how the CLI produces multiple passwords."""
+    
+    def test_duplicates_allowed_on_every_path(self):
+        """Test that a tiny keyspace yields count passwords, strength shown or not."""
+        digits_only = ['-c', '12', '-l', '1', '--no-uppercase', '--no-lowercase', '--no-special']
+        cases = [
+            (digits_only, True),
+            (digits_only + ['--no-strength'], False),
+            (['-c', '12', '-l', '1', '--custom-chars', 'ab'], True),
+        ]
+        for argv, with_meta in cases:
+            with self.subTest(argv=argv):
+                args = cli._build_parser().parse_args(argv)
+                passwords = [password for password, _ in cli._iter_passwords(args, with_meta)]
+                
+                self.assertEqual(len(passwords), 12)
+                alphabet = 'ab' if '--custom-chars' in argv else string.digits
+                self.assertTrue(set(passwords) <= set(alphabet))
+
+
+if __name__ == '__main__':
+    unittest.main()
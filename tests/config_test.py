@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for RPG configuration module.
+"""
+
+import copy
+import json
+import os
+import tempfile
+import unittest
+from source.config import Config, DEFAULT_CONFIG
+
+
+class TestConfig(unittest.TestCase):
+    """Test configuration loading and lookups."""
+    
+    def test_get_dotted_key(self):
+        """Test dot-notation lookups against defaults."""
+        config = Config()
+        self.assertEqual(config.get('defaults.length'), 16)
+        self.assertEqual(config.get('templates.wifi.length'), 24)
+        self.assertIsNone(config.get('defaults.missing'))
+        self.assertEqual(config.get('missing.key', 'fallback'), 'fallback')
+    
+    def test_set_does_not_leak_into_defaults(self):
+        """Test that modifying one instance leaves other instances untouched."""
+        config = Config()
+        config.set('templates.web.length', 99)
+        
+        self.assertEqual(config.get('templates.web.length'), 99)
+        self.assertEqual(Config().get('templates.web.length'), 16)
+        self.assertEqual(DEFAULT_CONFIG['templates']['web']['length'], 16)
+    
+    def test_sections_are_plain_dicts(self):
+        """Test that sections come back as dicts whether or not they were modified."""
+        modified = Config()
+        modified.set('templates.web.length', 99)
+        
+        for config in (Config(), modified):
+            for value in (config.get('defaults'), config.get('templates'),
+                          config.get_template('web'), config.config['templates']):
+                self.assertIsInstance(value, dict)
+                json.dumps(value)
+                copy.deepcopy(value)
+            
+            self.assertIsInstance(config.get('templates')['web'], dict)
+    
+    def test_load_json(self):
+        """Test loading and merging a JSON config file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'defaults': {'length': 20}, 'output': {'save_to_history': True}}, f)
+            
+            config = Config(path)
+        
+        self.assertEqual(config.get('defaults.length'), 20)
+        self.assertTrue(config.get('output.save_to_history'))
+        self.assertEqual(config.get('defaults.passphrase_words'), 4)
+        self.assertEqual(Config().get('defaults.length'), 16)
+    
+    def test_load_merges_nested_sections(self):
+        """Test that a partial template keeps the remaining default fields."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'templates': {'wifi': {'length': 30}}}, f)
+            
+            config = Config(path)
+        
+        self.assertEqual(config.get('templates.wifi.length'), 30)
+        self.assertFalse(config.get('templates.wifi.use_special'))
+        self.assertEqual(config.get('templates.web.length'), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
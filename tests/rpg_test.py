@@ -8,6 +8,12 @@ import unittest
 import string
 from source import rpg
 
+# Character classes as sets, for membership checks in predicates
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGIT = frozenset(string.digits)
+_PUNCT = frozenset(string.punctuation)
+
 
 class TestPasswordGeneration(unittest.TestCase):
     """Test password generation functions."""
@@ -20,25 +26,27 @@ class TestPasswordGeneration(unittest.TestCase):
     def test_generate_password_custom_length(self):
         """Test password with custom length."""
         for length in [8, 12, 20, 32]:
-            password = rpg.generate_password(length=length)
-            self.assertEqual(len(password), length)
+            with self.subTest(length=length):
+                password = rpg.generate_password(length=length)
+                self.assertEqual(len(password), length)
     
     def test_generate_password_character_types(self):
         """Test that password contains required character types."""
         password = rpg.generate_password(length=20)
         
         # Should contain all types by default
-        has_upper = any(c in string.ascii_uppercase for c in password)
-        has_lower = any(c in string.ascii_lowercase for c in password)
-        has_digit = any(c in string.digits for c in password)
-        has_special = any(c in string.punctuation for c in password)
+        chars = set(password)
+        has_upper = not chars.isdisjoint(_UPPER)
+        has_lower = not chars.isdisjoint(_LOWER)
+        has_digit = not chars.isdisjoint(_DIGIT)
+        has_special = not chars.isdisjoint(_PUNCT)
         
         self.assertTrue(has_upper or has_lower or has_digit or has_special)
     
     def test_generate_password_no_special(self):
         """Test password without special characters."""
         password = rpg.generate_password(length=20, use_special=False)
-        has_special = any(c in string.punctuation for c in password)
+        has_special = not _PUNCT.isdisjoint(password)
         self.assertFalse(has_special)
     
     def test_generate_password_only_digits(self):
@@ -77,6 +85,29 @@ class TestPasswordGeneration(unittest.TestCase):
                 use_digits=False,
                 use_special=False
             )
+    
+    def test_generate_password_with_meta(self):
+        """Test that returned metadata matches a full strength analysis."""
+        from source.strength import analyze_password_strength
+        
+        cases = [
+            dict(length=16),
+            dict(length=12, use_special=False),
+            dict(length=2),
+            dict(length=8, custom_chars="ab12"),
+        ]
+        for kwargs in cases:
+            with self.subTest(**kwargs):
+                password, meta = rpg.generate_password(with_meta=True, **kwargs)
+                analysis = analyze_password_strength(password)
+                
+                self.assertEqual(meta.length, len(password))
+                self.assertEqual(meta.has_uppercase, analysis['has_uppercase'])
+                self.assertEqual(meta.has_lowercase, analysis['has_lowercase'])
+                self.assertEqual(meta.has_digits, analysis['has_digits'])
+                self.assertEqual(meta.has_special, analysis['has_special'])
+                self.assertEqual(meta.char_classes, analysis['char_classes'])
+                self.assertAlmostEqual(meta.entropy, analysis['entropy'], delta=0.01)
 
 
 class TestMultiplePasswords(unittest.TestCase):
@@ -91,12 +122,104 @@ class TestMultiplePasswords(unittest.TestCase):
         # All should be unique
         self.assertEqual(len(set(passwords)), count)
     
+    def test_generate_multiple_passwords_small_keyspace(self):
+        """Test uniqueness when collisions are likely."""
+        passwords = rpg.generate_multiple_passwords(
+            count=10,
+            length=1,
+            use_uppercase=False,
+            use_lowercase=False,
+            use_special=False
+        )
+        
+        self.assertEqual(sorted(passwords), list(string.digits))
+    
+    def test_generate_multiple_passwords_custom(self):
+        """Test unique passwords from a custom character set."""
+        passwords = rpg.generate_multiple_passwords_custom(count=9, length=2, custom_chars="abc")
+        
+        self.assertEqual(len(set(passwords)), 9)
+        for password in passwords:
+            self.assertEqual(len(password), 2)
+            self.assertTrue(set(password) <= set("abc"))
+    
+    def test_iter_passwords(self):
+        """Test that the lazy generator yields count unique passwords across batches."""
+        passwords = list(rpg.iter_passwords(
+            count=10,
+            length=1,
+            batch_size=3,
+            use_uppercase=False,
+            use_lowercase=False,
+            use_special=False
+        ))
+        
+        self.assertEqual(sorted(passwords), list(string.digits))
+        
+        with self.assertRaises(ValueError):
+            next(rpg.iter_passwords(count=0))
+        
+        # Only 10 one-digit passwords exist, so 11 can never be produced
+        with self.assertRaises(ValueError):
+            next(rpg.iter_passwords(
+                count=11,
+                length=1,
+                use_uppercase=False,
+                use_lowercase=False,
+                use_special=False
+            ))
+        
+        # Duplicates are fine when uniqueness is not asked for
+        passwords = list(rpg.iter_passwords(count=12, length=1, unique=False, custom_chars="ab"))
+        self.assertEqual(len(passwords), 12)
+    
+    def test_keyspace_limits_unique_count(self):
+        """Test that asking for more unique passwords than exist raises instead of hanging."""
+        # Two letters, at least one of each case: 26 * 26 * 2 passwords
+        letters = dict(length=2, use_digits=False, use_special=False)
+        self.assertEqual(len(list(rpg.iter_passwords(count=1352, **letters))), 1352)
+        
+        cases = [
+            lambda: next(rpg.iter_passwords(count=1353, **letters)),
+            lambda: rpg.generate_multiple_passwords(count=1353, **letters),
+            lambda: rpg.generate_multiple_passwords_custom(count=5, length=2, custom_chars="ab"),
+        ]
+        for i, generate in enumerate(cases):
+            with self.subTest(case=i):
+                with self.assertRaises(ValueError):
+                    generate()
+    
     def test_generate_multiple_passwords_invalid_count(self):
         """Test that invalid count raises ValueError."""
         with self.assertRaises(ValueError):
             rpg.generate_multiple_passwords(count=0)
 
 
+class TestBatchPasswords(unittest.TestCase):
+    """Test batched password generation."""
+    
+    def test_generate_passwords_batch(self):
+        """Test count, length and alphabet of batched passwords."""
+        alphabet = "abc123"
+        passwords = rpg.generate_passwords_batch(count=50, length=10, alphabet=alphabet)
+        
+        self.assertEqual(len(passwords), 50)
+        for password in passwords:
+            self.assertEqual(len(password), 10)
+            self.assertTrue(set(password) <= set(alphabet))
+    
+    def test_generate_passwords_batch_invalid(self):
+        """Test that invalid arguments raise ValueError."""
+        with self.assertRaises(ValueError):
+            rpg.generate_passwords_batch(count=0, length=10, alphabet="abc")
+        
+        with self.assertRaises(ValueError):
+            rpg.generate_passwords_batch(count=5, length=0, alphabet="abc")
+        
+        with self.assertRaises(ValueError):
+            rpg.generate_passwords_batch(count=5, length=10, alphabet="")
+
+
 class TestPassphraseGeneration(unittest.TestCase):
     """Test passphrase generation."""
     
@@ -113,9 +236,10 @@ class TestPassphraseGeneration(unittest.TestCase):
     def test_generate_passphrase_custom_word_count(self):
         """Test passphrase with custom word count."""
         for count in [3, 5, 6]:
-            passphrase = rpg.generate_passphrase(word_count=count)
-            words = passphrase.split('-')
-            self.assertEqual(len(words), count)
+            with self.subTest(word_count=count):
+                passphrase = rpg.generate_passphrase(word_count=count)
+                words = passphrase.split('-')
+                self.assertEqual(len(words), count)
     
     def test_generate_passphrase_custom_separator(self):
         """Test passphrase with custom separator."""
@@ -145,6 +269,27 @@ class TestPassphraseGeneration(unittest.TestCase):
         """Test that invalid word count raises ValueError."""
         with self.assertRaises(ValueError):
             rpg.generate_passphrase(word_count=0)
+    
+    def test_generate_passphrases_batch(self):
+        """Test batched passphrase generation."""
+        passphrases = rpg.generate_passphrases_batch(
+            count=10, word_count=3, separator='_', include_number=True
+        )
+        
+        self.assertEqual(len(passphrases), 10)
+        for passphrase in passphrases:
+            parts = passphrase.split('_')
+            self.assertEqual(len(parts), 4)
+            self.assertTrue(parts[-1].isdigit())
+            self.assertTrue(all(word[0].isupper() for word in parts[:-1]))
+    
+    def test_generate_passphrases_batch_invalid(self):
+        """Test that invalid batch arguments raise ValueError."""
+        with self.assertRaises(ValueError):
+            rpg.generate_passphrases_batch(count=0)
+        
+        with self.assertRaises(ValueError):
+            rpg.generate_passphrases_batch(count=3, word_count=0)
 
 
 class TestLegacyFunctions(unittest.TestCase):
@@ -158,7 +303,7 @@ class TestLegacyFunctions(unittest.TestCase):
         self.assertEqual(len(password), 12)
         
         # Should not contain special characters
-        has_special = any(c in string.punctuation for c in password)
+        has_special = not _PUNCT.isdisjoint(password)
         self.assertFalse(has_special)
     
     def test_random_password_generator_ico(self):
@@ -175,10 +320,12 @@ class TestSpecialFunctions(unittest.TestCase):
     
     def test_generate_pin(self):
         """Test PIN generation."""
-        pin = rpg.generate_pin(length=6)
-        
-        self.assertEqual(len(pin), 6)
-        self.assertTrue(pin.isdigit())
+        for length in [4, 6, 8]:
+            with self.subTest(length=length):
+                pin = rpg.generate_pin(length=length)
+                
+                self.assertEqual(len(pin), length)
+                self.assertTrue(pin.isdigit())
     
     def test_generate_pin_default(self):
         """Test default PIN generation."""
@@ -187,19 +334,29 @@ class TestSpecialFunctions(unittest.TestCase):
     
     def test_generate_hex_key(self):
         """Test hex key generation."""
-        key = rpg.generate_hex_key(length=32)
-        
-        self.assertEqual(len(key), 32)
-        # Should be valid hexadecimal
-        try:
-            int(key, 16)
-        except ValueError:
-            self.fail("Generated key is not valid hexadecimal")
+        for length in [16, 32, 64]:
+            with self.subTest(length=length):
+                key = rpg.generate_hex_key(length=length)
+                
+                self.assertEqual(len(key), length)
+                # Should be valid hexadecimal
+                try:
+                    int(key, 16)
+                except ValueError:
+                    self.fail("Generated key is not valid hexadecimal")
     
     def test_generate_hex_key_default(self):
         """Test default hex key generation."""
         key = rpg.generate_hex_key()
         self.assertEqual(len(key), 32)
+    
+    def test_generate_hex_key_odd_length(self):
+        """Test that odd lengths are honoured exactly."""
+        for length in (1, 7, 33):
+            with self.subTest(length=length):
+                key = rpg.generate_hex_key(length=length)
+                self.assertEqual(len(key), length)
+                int(key, 16)
 
 
 class TestRandomness(unittest.TestCase):
@@ -207,18 +364,19 @@ class TestRandomness(unittest.TestCase):
     
     def test_password_uniqueness(self):
         """Test that generated passwords are unique."""
-        passwords = [rpg.generate_password(length=16) for _ in range(100)]
+        # Birthday bound: P(collision) <= C(20, 2) / 94**16 < 1e-29
+        passwords = [rpg.generate_password(length=16) for _ in range(20)]
         
         # All should be unique
         self.assertEqual(len(passwords), len(set(passwords)))
     
     def test_passphrase_uniqueness(self):
         """Test that generated passphrases are unique."""
-        passphrases = [rpg.generate_passphrase() for _ in range(50)]
+        # Birthday bound: P(collision) <= C(15, 2) / 515**4 < 2e-9
+        passphrases = [rpg.generate_passphrase() for _ in range(15)]
         
-        # Most should be unique (allowing for very rare collisions)
-        unique_ratio = len(set(passphrases)) / len(passphrases)
-        self.assertGreater(unique_ratio, 0.95)
+        # All should be unique
+        self.assertEqual(len(set(passphrases)), len(passphrases))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for RPG password strength analysis.
+"""
+
+import unittest
+from source.strength import analyze_batch, analyze_password_strength
+
+SEQUENTIAL = "Avoid sequential characters (abc, 123)"
+REPEATED = "Avoid repeated characters (aaa, 111)"
+KEYBOARD = "Avoid keyboard patterns (qwerty, asdf)"
+
+
+class TestPatternPenalties(unittest.TestCase):
+    """Test detection of weak patterns."""
+    
+    def test_patterns_detected(self):
+        """Test that each pattern is reported independently."""
+        cases = [
+            ("Xk9!mP2@", set()),
+            ("Xk9!ABCmP", {SEQUENTIAL}),
+            ("Xk9!aaamP", {REPEATED}),
+            ("Xk9!QWERTYmP", {KEYBOARD}),
+            ("zxcvbn!789", {SEQUENTIAL, KEYBOARD}),
+            ("asdfgh111bcd", {SEQUENTIAL, REPEATED, KEYBOARD}),
+        ]
+        for password, expected in cases:
+            with self.subTest(password=password):
+                feedback = set(analyze_password_strength(password)['feedback'])
+                self.assertEqual(feedback & {SEQUENTIAL, REPEATED, KEYBOARD}, expected)
+    
+    def test_common_password_case_insensitive(self):
+        """Test that common passwords are found regardless of case."""
+        self.assertTrue(analyze_password_strength("PassWord")['is_common'])
+        self.assertFalse(analyze_password_strength("Xk9!mP2@")['is_common'])
+
+
+class TestBatchAnalysis(unittest.TestCase):
+    """Test bulk entropy and composition analysis."""
+    
+    def test_matches_single_analysis(self):
+        """Test that batch results equal per-password analysis."""
+        passwords = ["", "abc", "ABCdef123", "Xk9!mP2@", "héllo wörld"]
+        for password, (entropy, char_classes) in zip(passwords, analyze_batch(passwords)):
+            with self.subTest(password=password):
+                analysis = analyze_password_strength(password)
+                self.assertEqual(round(entropy, 2), analysis['entropy'])
+                self.assertEqual(char_classes, analysis['char_classes'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for RPG utility functions.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from source import utils
+
+
+class TestHistory(unittest.TestCase):
+    """Test password history tracking."""
+    
+    def setUp(self):
+        fd, self.history_file = tempfile.mkstemp(suffix='.ndjson')
+        os.close(fd)
+        os.remove(self.history_file)
+        self.legacy_file = os.path.splitext(self.history_file)[0] + '.json'
+    
+    def tearDown(self):
+        for path in (self.history_file, self.legacy_file):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def test_saved_passwords_are_found(self):
+        """Test that saved passwords are found and others are not."""
+        utils.save_to_history_batch(['first', 'second'], self.history_file)
+        utils.save_to_history('third', self.history_file)
+        
+        self.assertTrue(utils.check_history('first', self.history_file))
+        self.assertTrue(utils.check_history('third', self.history_file))
+        self.assertFalse(utils.check_history('fourth', self.history_file))
+    
+    def test_history_is_compacted(self):
+        """Test that old entries are dropped once the history grows large."""
+        for i in range(250):
+            utils.save_to_history(f'password-{i:03d}', self.history_file)
+        
+        with open(self.history_file, encoding='utf-8') as f:
+            entries = f.readlines()
+        
+        self.assertLessEqual(len(entries), 200)
+        self.assertFalse(utils.check_history('password-000', self.history_file))
+        self.assertTrue(utils.check_history('password-249', self.history_file))
+    
+    def test_legacy_history_is_migrated(self):
+        """Test that entries from an old JSON history file are still found."""
+        legacy = {'passwords': [
+            {'hash': hashlib.sha256(b'old-sha256').hexdigest(), 'length': 10},
+            {'hash': utils.hash_password('old-blake2b'), 'length': 11},
+        ]}
+        with open(self.legacy_file, 'w', encoding='utf-8') as f:
+            json.dump(legacy, f)
+        
+        self.assertTrue(utils.check_history('old-sha256', self.history_file))
+        self.assertTrue(utils.check_history('old-blake2b', self.history_file))
+        self.assertFalse(utils.check_history('never-saved', self.history_file))
+        
+        utils.save_to_history('new', self.history_file)
+        
+        self.assertTrue(utils.check_history('new', self.history_file))
+        self.assertTrue(utils.check_history('old-sha256', self.history_file))
+        self.assertTrue(os.path.exists(self.legacy_file))
+    
+    def test_legacy_history_path_is_converted(self):
+        """Test that an old JSON history passed explicitly is rewritten as NDJSON."""
+        legacy = {'passwords': [{'hash': utils.hash_password('old'), 'length': 3}]}
+        with open(self.legacy_file, 'w', encoding='utf-8') as f:
+            json.dump(legacy, f, indent=2)
+        
+        self.assertTrue(utils.save_to_history('new', self.legacy_file))
+        
+        with open(self.legacy_file, encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f]
+        
+        self.assertEqual(len(entries), 2)
+        self.assertTrue(utils.check_history('old', self.legacy_file))
+        self.assertTrue(utils.check_history('new', self.legacy_file))
+    
+    def test_unreadable_legacy_history_is_not_appended_to(self):
+        """Test that a damaged old JSON history is left as is."""
+        with open(self.legacy_file, 'w', encoding='utf-8') as f:
+            f.write('{"passwords": [')
+        
+        self.assertFalse(utils.save_to_history('new', self.legacy_file))
+        
+        with open(self.legacy_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '{"passwords": [')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the RPG web API.
+"""
+
+import hashlib
+import json
+import unittest
+from unittest import mock
+from web import api
+
+# Both front ends are optional extras; test whichever are installed
+try:
+    from web.app import app as flask_app
+    HAS_FLASK = True
+except ImportError:
+    HAS_FLASK = False
+
+try:
+    from starlette.testclient import TestClient
+    from web.asgi import app as asgi_app
+    HAS_STARLETTE = True
+except (ImportError, RuntimeError):
+    HAS_STARLETTE = False
+
+
+def _flask_request(method, path, body=b''):
+    """Send a request through the Flask test client; return (status, body)."""
+    response = flask_app.test_client().open(
+        path, method=method, data=body, content_type='application/json'
+    )
+    return response.status_code, response.get_data()
+
+
+def _asgi_request(method, path, body=b''):
+    """Send a request through the Starlette test client; return (status, body)."""
+    response = TestClient(asgi_app).request(
+        method, path, content=body, headers={'Content-Type': 'application/json'}
+    )
+    return response.status_code, response.content
+
+
+class _ServerTests:
+    """Checks run against each web front end; subclasses set request()."""
+    
+    request = None
+    
+    def post(self, path, data):
+        """POST data (a dict, or raw bytes) and return (status, body)."""
+        body = data if isinstance(data, bytes) else json.dumps(data).encode('utf-8')
+        return type(self).request('POST', path, body)
+    
+    def test_generate(self):
+        """Test a successful /api/generate request."""
+        status, body = self.post('/api/generate', {'length': 12, 'count': 3})
+        result = json.loads(body)
+        
+        self.assertEqual(status, 200)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['count'], 3)
+        self.assertEqual([len(password) for password in result['passwords']], [12] * 3)
+    
+    def test_analyze(self):
+        """Test a successful /api/analyze request."""
+        status, body = self.post('/api/analyze', {'password': 'Xk9!mP2@'})
+        result = json.loads(body)
+        
+        self.assertEqual(status, 200)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['analysis']['length'], 8)
+    
+    def test_out_of_range(self):
+        """Test that out-of-range length and count are rejected."""
+        cases = [
+            ({'length': 129}, api._ERR_LENGTH),
+            ({'count': 0}, api._ERR_COUNT),
+        ]
+        for data, expected in cases:
+            with self.subTest(data=data):
+                self.assertEqual(self.post('/api/generate', data), (400, expected))
+    
+    def test_impossible_unique_count(self):
+        """Test that more unique passwords than the options allow is a 400, not a hang."""
+        data = {
+            'length': 1,
+            'count': 11,
+            'use_uppercase': False,
+            'use_lowercase': False,
+            'use_special': False
+        }
+        status, body = self.post('/api/generate', data)
+        
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(body), {
+            'success': False,
+            'error': 'Cannot generate 11 unique passwords: only 10 exist'
+        })
+    
+    def test_malformed_json(self):
+        """Test that a body that is not JSON is rejected."""
+        status, body = self.post('/api/generate', b'{not json')
+        
+        self.assertEqual(status, 400)
+        self.assertFalse(json.loads(body)['success'])
+    
+    def test_unknown_route_and_method(self):
+        """Test the 404 and 405 JSON envelopes."""
+        request = type(self).request
+        self.assertEqual(request('GET', '/api/missing'), (404, api.ERR_NOT_FOUND))
+        self.assertEqual(request('GET', '/api/generate'), (405, api.ERR_METHOD_NOT_ALLOWED))
+
+
+@unittest.skipUnless(HAS_FLASK, "Flask is not installed")
+class TestFlaskApp(_ServerTests, unittest.TestCase):
+    """Test the API through the Flask app."""
+    
+    request = staticmethod(_flask_request)
+
+
+@unittest.skipUnless(HAS_STARLETTE, "Starlette is not installed")
+class TestAsgiApp(_ServerTests, unittest.TestCase):
+    """Test the API through the Starlette app."""
+    
+    request = staticmethod(_asgi_request)
+
+
+@unittest.skipUnless(HAS_FLASK and HAS_STARLETTE, "Flask and Starlette are both needed")
+class TestServerParity(unittest.TestCase):
+    """Test that both front ends answer identically."""
+    
+    def test_same_body_for_same_request(self):
+        """Test that deterministic requests get byte-identical responses."""
+        cases = [
+            ('POST', '/api/analyze', b'{"password": "Xk9!mP2@"}'),
+            ('POST', '/api/generate', b'{"length": 0}'),
+            ('POST', '/api/generate', b'{"count": 101}'),
+            ('POST', '/api/passphrase', b'{"word_count": 21}'),
+            ('POST', '/api/analyze', b'{not json'),
+            ('GET', '/api/info', b''),
+            ('GET', '/api/missing', b''),
+            ('GET', '/api/generate', b''),
+        ]
+        for method, path, body in cases:
+            with self.subTest(method=method, path=path, body=body):
+                self.assertEqual(
+                    _flask_request(method, path, body),
+                    _asgi_request(method, path, body)
+                )
+
+
+class TestAnalyzeCache(unittest.TestCase):
+    """Test the /api/analyze response cache."""
+    
+    def setUp(self):
+        api._analyze_cache.clear()
+    
+    def tearDown(self):
+        api._analyze_cache.clear()
+    
+    def test_repeated_password_is_served_from_cache(self):
+        """Test that a repeated password returns the cached bytes without re-analyzing."""
+        first = api._analyze_body('Xk9!mP2@')
+        
+        with mock.patch('source.strength.analyze_password_strength') as analyze:
+            second = api._analyze_body('Xk9!mP2@')
+        
+        analyze.assert_not_called()
+        self.assertIs(second, first)
+    
+    def test_oldest_entry_is_evicted(self):
+        """Test that the least recently used password is dropped past the cap."""
+        with mock.patch.object(api, '_ANALYZE_CACHE_SIZE', 2):
+            api._analyze_body('first')
+            api._analyze_body('second')
+            api._analyze_body('first')
+            api._analyze_body('third')
+        
+        def key(password):
+            return hashlib.blake2b(password.encode('utf-8'), digest_size=16).digest()
+        
+        self.assertEqual(list(api._analyze_cache), [key('first'), key('third')])
+    
+    def test_keys_are_digests(self):
+        """Test that the cache never holds a plaintext password as a key."""
+        passwords = ['hunter2', 'correct horse battery staple', 'pässwörd']
+        for password in passwords:
+            api._analyze_body(password)
+        
+        for key in api._analyze_cache:
+            self.assertEqual(len(key), 16)
+            self.assertNotIn(key, [password.encode('utf-8') for password in passwords])
+        
+        self.assertEqual(len(api._analyze_cache), len(passwords))
+
+
+class TestJsonErrors(unittest.TestCase):
+    """Test the error envelopes produced by json_errors."""
+    
+    def test_malformed_json(self):
+        """Test that malformed JSON is a 400 carrying the parser's message."""
+        body = b'{not json'
+        with self.assertRaises(ValueError) as cm:
+            api._loads(body)
+        expected = api.dumps({'success': False, 'error': str(cm.exception)})
+        
+        for handler in (api.generate, api.analyze):
+            with self.subTest(handler=handler.__name__):
+                self.assertEqual(handler(body), (expected, 400))
+    
+    def test_unexpected_exception(self):
+        """Test that any other exception becomes a 500 JSON envelope."""
+        expected = api.dumps({'success': False, 'error': 'Internal server error: boom'})
+        
+        with mock.patch('source.rpg.generate_multiple_passwords', side_effect=RuntimeError('boom')):
+            self.assertEqual(api.generate(b'{}'), (expected, 500))
+
+
+class TestValidation(unittest.TestCase):
+    """Test the request range checks."""
+    
+    def test_range_edges(self):
+        """Test both edges of each range, with the exact error messages."""
+        cases = [
+            (api.generate, {'length': 1}, None),
+            (api.generate, {'length': 128}, None),
+            (api.generate, {'length': 0}, 'Length must be between 1 and 128'),
+            (api.generate, {'length': 129}, 'Length must be between 1 and 128'),
+            (api.generate, {'count': 1}, None),
+            (api.generate, {'count': 100}, None),
+            (api.generate, {'count': 0}, 'Count must be between 1 and 100'),
+            (api.generate, {'count': 101}, 'Count must be between 1 and 100'),
+            (api.passphrase, {'word_count': 1}, None),
+            (api.passphrase, {'word_count': 20}, None),
+            (api.passphrase, {'word_count': 0}, 'Word count must be between 1 and 20'),
+            (api.passphrase, {'word_count': 21}, 'Word count must be between 1 and 20'),
+        ]
+        for handler, data, error in cases:
+            with self.subTest(handler=handler.__name__, data=data):
+                body, status = handler(json.dumps(data).encode('utf-8'))
+                result = json.loads(body)
+                
+                if error is None:
+                    self.assertEqual(status, 200)
+                    self.assertTrue(result['success'])
+                else:
+                    self.assertEqual(status, 400)
+                    self.assertEqual(result, {'success': False, 'error': error})
+    
+    def test_invalid_input_is_a_400(self):
+        """Test that _InvalidInput passes through json_errors as a 400, not a 500."""
+        @api.json_errors
+        def handler():
+            api._validate(length=0)
+        
+        self.assertEqual(handler(), (api._ERR_LENGTH, 400))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Framework-independent request handling for the RPG web API.
+
+Each handler takes the raw request body and returns the serialized JSON
+response body with its HTTP status code, so the Flask (web/app.py) and
+ASGI (web/asgi.py) front ends share one implementation.
+"""
+
+from collections import OrderedDict
+import functools
+import hashlib
+import json
+import threading
+from typing import Optional, Tuple
+
+# Optional faster JSON backend
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# The source package (generator, analyzer, wordlist) is imported inside the
+# handlers so worker startup and test collection don't pay for it up front
+
+MAX_PASSPHRASE_WORDS = 20
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(body: bytes):
+    """
+    Parse a request body as JSON, using orjson when available.
+    
+    Args:
+        body: Raw request body
+    
+    Returns:
+        Parsed data, or an empty dict for an empty body
+    
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if not body:
+        return {}
+    if HAS_ORJSON:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+# Fixed error responses, serialized once
+_ERR_LENGTH = dumps({'success': False, 'error': 'Length must be between 1 and 128'})
+_ERR_COUNT = dumps({'success': False, 'error': 'Count must be between 1 and 100'})
+_ERR_WORD_COUNT = dumps({
+    'success': False,
+    'error': f'Word count must be between 1 and {MAX_PASSPHRASE_WORDS}'
+})
+_ERR_NO_PASSWORD = dumps({'success': False, 'error': 'Password is required'})
+ERR_NOT_FOUND = dumps({'success': False, 'error': 'Endpoint not found'})
+ERR_METHOD_NOT_ALLOWED = dumps({'success': False, 'error': 'Method not allowed'})
+ERR_INTERNAL = dumps({'success': False, 'error': 'Internal server error'})
+
+
+class _InvalidInput(ValueError):
+    """Out-of-range request field; carries the serialized error body."""
+    
+    def __init__(self, body: bytes):
+        super().__init__(body)
+        self.body = body
+
+
+def _validate(
+    length: Optional[int] = None,
+    count: Optional[int] = None,
+    word_count: Optional[int] = None
+) -> None:
+    """
+    Check request fields against their allowed ranges.
+    
+    Args:
+        length: Password length, if the endpoint takes one
+        count: Number of passwords, if the endpoint takes one
+        word_count: Passphrase word count, if the endpoint takes one
+    
+    Raises:
+        _InvalidInput: With the matching _ERR_* body for the first bad field
+    """
+    if length is not None and not 1 <= length <= 128:
+        raise _InvalidInput(_ERR_LENGTH)
+    if count is not None and not 1 <= count <= 100:
+        raise _InvalidInput(_ERR_COUNT)
+    if word_count is not None and not 1 <= word_count <= MAX_PASSPHRASE_WORDS:
+        raise _InvalidInput(_ERR_WORD_COUNT)
+
+
+@functools.lru_cache(maxsize=None)
+def _passphrase_entropy() -> Tuple[float, ...]:
+    """Entropy of a passphrase for each word count, computed on first use."""
+    from source.wordlist import calculate_passphrase_entropy
+    return tuple(
+        round(calculate_passphrase_entropy(word_count), 2)
+        for word_count in range(MAX_PASSPHRASE_WORDS + 1)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def info() -> bytes:
+    """
+    Return the serialized /api/info response.
+    
+    Returns:
+        JSON response body as bytes
+    """
+    from source.wordlist import get_wordlist_size
+    return dumps({
+        'name': 'RPG API',
+        'version': '2.0.0',
+        'wordlist_size': get_wordlist_size(),
+        'endpoints': {
+            'POST /api/generate': 'Generate passwords',
+            'POST /api/passphrase': 'Generate passphrases',
+            'POST /api/analyze': 'Analyze password strength',
+            'GET /api/info': 'API information'
+        }
+    })
+
+
+# Serialized /api/analyze responses, keyed by a BLAKE2b digest of the
+# password so plaintext is not kept around; process-local, never persisted
+_ANALYZE_CACHE_SIZE = 1024
+_analyze_cache = OrderedDict()
+_analyze_lock = threading.Lock()
+
+
+def _analyze_body(password: str) -> bytes:
+    """
+    Return the serialized /api/analyze success response for a password.
+    
+    Results for the last _ANALYZE_CACHE_SIZE distinct passwords are cached.
+    
+    Args:
+        password: Password to analyze
+    
+    Returns:
+        JSON response body as bytes
+    """
+    key = hashlib.blake2b(password.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    
+    with _analyze_lock:
+        body = _analyze_cache.get(key)
+        if body is not None:
+            _analyze_cache.move_to_end(key)
+            return body
+    
+    from source.strength import analyze_password_strength
+    body = dumps({
+        'success': True,
+        'analysis': analyze_password_strength(password)
+    })
+    
+    with _analyze_lock:
+        _analyze_cache[key] = body
+        if len(_analyze_cache) > _ANALYZE_CACHE_SIZE:
+            _analyze_cache.popitem(last=False)
+    
+    return body
+
+
+def json_errors(handler):
+    """
+    Turn exceptions raised by an API handler into JSON error responses.
+    
+    _InvalidInput becomes a 400 with its prepared body, other ValueErrors
+    (bad input, including malformed JSON) a 400 carrying their message, and
+    any other exception a 500.
+    
+    Args:
+        handler: Function returning (JSON response body, HTTP status code)
+    
+    Returns:
+        Wrapped handler with the same signature
+    """
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            return handler(*args, **kwargs)
+        except _InvalidInput as e:
+            return e.body, 400
+        except ValueError as e:
+            return dumps({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return dumps({
+                'success': False,
+                'error': f'Internal server error: {str(e)}'
+            }), 500
+    
+    return wrapper
+
+
+@json_errors
+def generate(body: bytes) -> Tuple[bytes, int]:
+    """
+    Handle an /api/generate request.
+    
+    Args:
+        body: Raw request body (see web.app.api_generate for the format)
+    
+    Returns:
+        Tuple of (JSON response body, HTTP status code)
+    """
+    from source import rpg
+    
+    data = _loads(body) or {}
+    
+    length = data.get('length', 16)
+    count = data.get('count', 1)
+    custom_chars = data.get('custom_chars', None)
+    
+    # Validate inputs
+    _validate(length=length, count=count)
+    
+    # Generate passwords; a custom set overrides the character types
+    if custom_chars:
+        passwords = rpg.generate_multiple_passwords_custom(count, length, custom_chars)
+    else:
+        passwords = rpg.generate_multiple_passwords(
+            count=count,
+            length=length,
+            use_uppercase=data.get('use_uppercase', True),
+            use_lowercase=data.get('use_lowercase', True),
+            use_digits=data.get('use_digits', True),
+            use_special=data.get('use_special', True)
+        )
+    
+    return dumps({
+        'success': True,
+        'passwords': passwords,
+        'count': len(passwords)
+    }), 200
+
+
+@json_errors
+def passphrase(body: bytes) -> Tuple[bytes, int]:
+    """
+    Handle an /api/passphrase request.
+    
+    Args:
+        body: Raw request body (see web.app.api_passphrase for the format)
+    
+    Returns:
+        Tuple of (JSON response body, HTTP status code)
+    """
+    from source import rpg
+    
+    data = _loads(body) or {}
+    
+    word_count = data.get('word_count', 4)
+    separator = data.get('separator', '-')
+    capitalize = data.get('capitalize', True)
+    include_number = data.get('include_number', False)
+    
+    # Validate inputs
+    _validate(word_count=word_count)
+    
+    # Generate passphrase
+    phrase = rpg.generate_passphrase(
+        word_count=word_count,
+        separator=separator,
+        capitalize=capitalize,
+        include_number=include_number
+    )
+    
+    return dumps({
+        'success': True,
+        'passphrase': phrase,
+        'entropy': _passphrase_entropy()[word_count]
+    }), 200
+
+
+@json_errors
+def analyze(body: bytes) -> Tuple[bytes, int]:
+    """
+    Handle an /api/analyze request.
+    
+    Args:
+        body: Raw request body (see web.app.api_analyze for the format)
+    
+    Returns:
+        Tuple of (JSON response body, HTTP status code)
+    """
+    data = _loads(body) or {}
+    password = data.get('password', '')
+    
+    if not password:
+        return _ERR_NO_PASSWORD, 400
+    
+    return _analyze_body(password), 200
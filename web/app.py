@@ -6,30 +6,44 @@ Flask Web Application for RPG
 Modern web interface for password generation.
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request
 from flask_cors import CORS
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from source import rpg
-from source.strength import analyze_password_strength
-from source.wordlist import get_wordlist_size, calculate_passphrase_entropy
+from web import api
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for API access
 
-# Configuration
-app.config['JSON_AS_ASCII'] = False
-app.config['JSON_SORT_KEYS'] = False
+
+def _raw(body, status=200):
+    """
+    Build a JSON response from an already serialized body.
+    
+    Args:
+        body: JSON body as bytes (see web.api)
+        status: HTTP status code
+    
+    Returns:
+        Flask response with an application/json body
+    """
+    return app.response_class(body, status=status, mimetype='application/json')
+
+
+# The page takes no template context, so it is rendered once per process
+# (on the first hit, inside a real request so url_for() sees the mount point)
+_index_page = None
 
 
 @app.route('/')
 def index():
     """Serve the main page."""
-    return render_template('index.html')
+    global _index_page
+    # Re-render in debug mode so template edits show up without a restart
+    if _index_page is None or app.debug:
+        _index_page = render_template('index.html').encode('utf-8')
+    return app.response_class(_index_page, mimetype='text/html')
 
 
 @app.route('/api/generate', methods=['POST'])
@@ -55,57 +69,7 @@ def api_generate():
             "count": 1
         }
     """
-    try:
-        data = request.get_json() or {}
-        
-        length = data.get('length', 16)
-        count = data.get('count', 1)
-        use_uppercase = data.get('use_uppercase', True)
-        use_lowercase = data.get('use_lowercase', True)
-        use_digits = data.get('use_digits', True)
-        use_special = data.get('use_special', True)
-        custom_chars = data.get('custom_chars', None)
-        
-        # Validate inputs
-        if length < 1 or length > 128:
-            return jsonify({
-                'success': False,
-                'error': 'Length must be between 1 and 128'
-            }), 400
-        
-        if count < 1 or count > 100:
-            return jsonify({
-                'success': False,
-                'error': 'Count must be between 1 and 100'
-            }), 400
-        
-        # Generate passwords
-        passwords = rpg.generate_multiple_passwords(
-            count=count,
-            length=length,
-            use_uppercase=use_uppercase,
-            use_lowercase=use_lowercase,
-            use_digits=use_digits,
-            use_special=use_special,
-            custom_chars=custom_chars
-        )
-        
-        return jsonify({
-            'success': True,
-            'passwords': passwords,
-            'count': len(passwords)
-        })
-        
-    except ValueError as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': f'Internal server error: {str(e)}'
-        }), 500
+    return _raw(*api.generate(request.get_data()))
 
 
 @app.route('/api/passphrase', methods=['POST'])
@@ -128,48 +92,7 @@ def api_passphrase():
             "entropy": 51.7
         }
     """
-    try:
-        data = request.get_json() or {}
-        
-        word_count = data.get('word_count', 4)
-        separator = data.get('separator', '-')
-        capitalize = data.get('capitalize', True)
-        include_number = data.get('include_number', False)
-        
-        # Validate inputs
-        if word_count < 1 or word_count > 20:
-            return jsonify({
-                'success': False,
-                'error': 'Word count must be between 1 and 20'
-            }), 400
-        
-        # Generate passphrase
-        passphrase = rpg.generate_passphrase(
-            word_count=word_count,
-            separator=separator,
-            capitalize=capitalize,
-            include_number=include_number
-        )
-        
-        # Calculate entropy
-        entropy = calculate_passphrase_entropy(word_count)
-        
-        return jsonify({
-            'success': True,
-            'passphrase': passphrase,
-            'entropy': round(entropy, 2)
-        })
-        
-    except ValueError as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': f'Internal server error: {str(e)}'
-        }), 500
+    return _raw(*api.passphrase(request.get_data()))
 
 
 @app.route('/api/analyze', methods=['POST'])
@@ -188,28 +111,7 @@ def api_analyze():
             "analysis": {...}
         }
     """
-    try:
-        data = request.get_json() or {}
-        password = data.get('password', '')
-        
-        if not password:
-            return jsonify({
-                'success': False,
-                'error': 'Password is required'
-            }), 400
-        
-        analysis = analyze_password_strength(password)
-        
-        return jsonify({
-            'success': True,
-            'analysis': analysis
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': f'Internal server error: {str(e)}'
-        }), 500
+    return _raw(*api.analyze(request.get_data()))
 
 
 @app.route('/api/info', methods=['GET'])
@@ -224,38 +126,38 @@ def api_info():
             "wordlist_size": 500
         }
     """
-    return jsonify({
-        'name': 'RPG API',
-        'version': '2.0.0',
-        'wordlist_size': get_wordlist_size(),
-        'endpoints': {
-            'POST /api/generate': 'Generate passwords',
-            'POST /api/passphrase': 'Generate passphrases',
-            'POST /api/analyze': 'Analyze password strength',
-            'GET /api/info': 'API information'
-        }
-    })
+    return _raw(api.info())
 
 
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
-    return jsonify({
-        'success': False,
-        'error': 'Endpoint not found'
-    }), 404
+    return _raw(api.ERR_NOT_FOUND, 404)
+
+
+@app.errorhandler(405)
+def method_not_allowed(error):
+    """Handle 405 errors."""
+    response = _raw(api.ERR_METHOD_NOT_ALLOWED, 405)
+    response.headers['Allow'] = ', '.join(error.valid_methods or ())
+    return response
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    return jsonify({
-        'success': False,
-        'error': 'Internal server error'
-    }), 500
+    return _raw(api.ERR_INTERNAL, 500)
 
 
 if __name__ == '__main__':
+    # The built-in server is single-threaded and runs the debugger; only
+    # use it for local development
+    if not os.environ.get('RPG_DEV'):
+        print("Use a WSGI server to run the web app, e.g.:")
+        print("    gunicorn -w $(nproc) -k gthread --threads 4 -b 0.0.0.0:5000 web.wsgi:application")
+        print("Set RPG_DEV=1 and run `python -m web.app` to start the development server instead.")
+        sys.exit(1)
+    
     print("""
     ╔═══════════════════════════════════════════════════════════╗
     ║     🔐 RPG Web Server v2.0 🔐                            ║
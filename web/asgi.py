@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ASGI entry point for the RPG web application (Starlette).
+
+Serves the same API as web/app.py without the WSGI stack. Run from the
+project root with, e.g.:
+    uvicorn web.asgi:app --workers $(nproc) --loop uvloop --http httptools --port 5000
+"""
+
+import os
+
+try:
+    from jinja2 import Environment, FileSystemLoader
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.concurrency import run_in_threadpool
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+    from starlette.staticfiles import StaticFiles
+except ImportError:
+    raise ImportError("The ASGI app requires Starlette: pip install -e .[asgi]")
+
+from web import api
+
+WEB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _render_index():
+    """
+    Render templates/index.html once, resolving Flask-style url_for() calls.
+    
+    Returns:
+        Page as UTF-8 bytes
+    """
+    env = Environment(loader=FileSystemLoader(os.path.join(WEB_DIR, 'templates')))
+    env.globals['url_for'] = lambda endpoint, filename: f'/{endpoint}/{filename}'
+    return env.get_template('index.html').render().encode('utf-8')
+
+
+_INDEX = _render_index()
+
+
+def _raw(body, status=200):
+    """
+    Build a JSON response from an already serialized body.
+    
+    Args:
+        body: JSON body as bytes (see web.api)
+        status: HTTP status code
+    
+    Returns:
+        Starlette response with an application/json body
+    """
+    return Response(body, status_code=status, media_type='application/json')
+
+
+# The API handlers are synchronous and CPU-bound (a long password to analyze
+# or a near-exhausted keyspace to dedupe can take a while), so they run in
+# the thread pool to keep one slow request from stalling the event loop
+
+
+async def index(request):
+    """Serve the main page."""
+    return Response(_INDEX, media_type='text/html')
+
+
+async def api_generate(request):
+    """Generate password(s) via API (see web.app.api_generate)."""
+    return _raw(*await run_in_threadpool(api.generate, await request.body()))
+
+
+async def api_passphrase(request):
+    """Generate passphrase via API (see web.app.api_passphrase)."""
+    return _raw(*await run_in_threadpool(api.passphrase, await request.body()))
+
+
+async def api_analyze(request):
+    """Analyze password strength via API (see web.app.api_analyze)."""
+    return _raw(*await run_in_threadpool(api.analyze, await request.body()))
+
+
+async def api_info(request):
+    """Get API information."""
+    return _raw(api.info())
+
+
+async def not_found(request, exc):
+    """Handle 404 errors."""
+    return _raw(api.ERR_NOT_FOUND, 404)
+
+
+async def method_not_allowed(request, exc):
+    """Handle 405 errors."""
+    return Response(
+        api.ERR_METHOD_NOT_ALLOWED,
+        status_code=405,
+        headers=exc.headers,
+        media_type='application/json'
+    )
+
+
+async def internal_error(request, exc):
+    """Handle 500 errors."""
+    return _raw(api.ERR_INTERNAL, 500)
+
+
+app = Starlette(
+    routes=[
+        Route('/', index),
+        Route('/api/generate', api_generate, methods=['POST']),
+        Route('/api/passphrase', api_passphrase, methods=['POST']),
+        Route('/api/analyze', api_analyze, methods=['POST']),
+        Route('/api/info', api_info, methods=['GET']),
+        Mount('/static', StaticFiles(directory=os.path.join(WEB_DIR, 'static')), name='static'),
+    ],
+    middleware=[
+        # Enable CORS for API access
+        Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*']),
+    ],
+    exception_handlers={
+        404: not_found,
+        405: method_not_allowed,
+        500: internal_error,
+    },
+)
+
+__all__ = ['app']
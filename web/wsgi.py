@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+WSGI entry point for the RPG web application.
+
+Run from the project root with a production server, e.g.:
+    gunicorn -w $(nproc) -k gthread --threads 4 -b 0.0.0.0:5000 web.wsgi:application
+"""
+
+from web.app import app as application
+
+__all__ = ['application']